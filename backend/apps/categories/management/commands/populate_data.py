@@ -14,6 +14,22 @@ class Command(BaseCommand):
     def handle(self, *args, **kwargs):
         fake = Faker()
 
+        # Choice keys are loop-invariant, so resolve them once up front
+        gender_keys = ('male', 'female', 'other')
+        experience_keys = ('entry', 'mid', 'senior', 'expert')
+        degree_keys = ('Bachelor', 'Master', 'PhD')
+        field_keys = ('Computer Science', 'Engineering', 'Business', 'Mathematics')
+        certification_keys = (
+            'AWS Certified Solutions Architect',
+            'Google Cloud Professional',
+            'Microsoft Azure Fundamentals',
+            'Certified Scrum Master',
+            'PMP Certification'
+        )
+        employment_keys = ('full_time', 'part_time', 'contract', 'internship', 'remote')
+        job_level_keys = ('entry', 'mid', 'senior', 'executive')
+        status_keys = tuple(key for key, _ in Application.STATUS_CHOICES)
+
         # Create Categories
         categories = []
         for _ in range(5):
@@ -63,7 +79,7 @@ class Command(BaseCommand):
                 user=user,
                 bio=fake.text(max_nb_chars=200),  # Keep shorter for encryption
                 date_of_birth=birth_date,
-                gender=fake.random_element(elements=('male', 'female', 'other')),
+                gender=random.choice(gender_keys),
                 phone_number=fake.phone_number()[:15],  # Keep shorter for encryption
                 address=fake.address()[:100],  # Keep shorter for encryption
                 city=fake.city(),
@@ -71,18 +87,12 @@ class Command(BaseCommand):
                 postal_code=fake.postcode(),
                 job_title=fake.job(),
                 company=fake.company(),
-                experience_level=fake.random_element(elements=('entry', 'mid', 'senior', 'expert')),
+                experience_level=random.choice(experience_keys),
                 expected_salary_min=fake.random_int(min=40000, max=80000),
                 expected_salary_max=fake.random_int(min=90000, max=150000),
-                skills=fake.random_element(elements=skills_list),
-                education=f'{fake.random_element(["Bachelor", "Master", "PhD"])} in {fake.random_element(["Computer Science", "Engineering", "Business", "Mathematics"])}',
-                certifications=fake.random_element([
-                    'AWS Certified Solutions Architect',
-                    'Google Cloud Professional',
-                    'Microsoft Azure Fundamentals',
-                    'Certified Scrum Master',
-                    'PMP Certification'
-                ]),
+                skills=random.choice(skills_list),
+                education=f'{random.choice(degree_keys)} in {random.choice(field_keys)}',
+                certifications=random.choice(certification_keys),
                 linkedin_url=f'https://linkedin.com/in/{user.username}',
                 github_url=f'https://github.com/{user.username}',
                 is_profile_public=fake.boolean(chance_of_getting_true=80),
@@ -100,23 +110,22 @@ class Command(BaseCommand):
                 description=fake.text(max_nb_chars=1000),
                 company_name=fake.company(),
                 location=fake.city(),
-                employment_type=fake.random_element(elements=('full_time', 'part_time', 'contract', 'internship', 'remote')),
-                experience_level=fake.random_element(elements=('entry', 'mid', 'senior', 'executive')),
+                employment_type=random.choice(employment_keys),
+                experience_level=random.choice(job_level_keys),
                 salary_min=fake.random_int(min=30000, max=50000),
                 salary_max=fake.random_int(min=60000, max=100000),
-                category=fake.random_element(elements=categories),
-                posted_by=fake.random_element(elements=users)
+                category=random.choice(categories),
+                posted_by=random.choice(users)
             )
             jobs.append(job)
         self.stdout.write(self.style.SUCCESS(f'Created {len(jobs)} jobs'))
 
         # Create Applications (avoid duplicates)
         applications = []
-        import random
         
         for _ in range(50):
-            job = fake.random_element(elements=jobs)
-            applicant = fake.random_element(elements=users)
+            job = random.choice(jobs)
+            applicant = random.choice(users)
             
             # Skip if application already exists
             if Application.objects.filter(job=job, applicant=applicant).exists():
@@ -130,7 +139,7 @@ class Command(BaseCommand):
                 job=job,
                 applicant=applicant,
                 cover_letter=fake.text(max_nb_chars=500),
-                status=fake.random_element(elements=Application.STATUS_CHOICES)[0]
+                status=random.choice(status_keys)
             )
             applications.append(application)
             
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['is_active', '-updated_at'], name='job_active_updated_idx'),
+        ),
+    ]
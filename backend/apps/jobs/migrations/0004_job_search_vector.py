@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:22
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_FIELDS = 'title, description, company_name, location, requirements'
+
+CREATE_TRIGGER = f"""
+    CREATE TRIGGER job_search_vector_update
+    BEFORE INSERT OR UPDATE ON jobs_job
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', {SEARCH_FIELDS});
+
+    UPDATE jobs_job
+    SET search_vector = to_tsvector('pg_catalog.english', concat_ws(' ', {SEARCH_FIELDS}));
+"""
+
+DROP_TRIGGER = "DROP TRIGGER IF EXISTS job_search_vector_update ON jobs_job;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_active_recent_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_search_vector_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from apps.categories.models import Category
 
 class Job(models.Model):
@@ -34,9 +36,32 @@ class Job(models.Model):
     application_deadline = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by the job_search_vector_update trigger, see migration 0004
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active', '-updated_at'], name='job_active_updated_idx'),
+            models.Index(fields=['is_active', '-created_at'], name='job_active_recent_idx'),
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(is_active=True),
+                name='job_recent_active_only_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='job_search_vector_idx'),
+        ]
         
     def __str__(self):
         return f"{self.title} at {self.company_name}"
+    
+    @property
+    def salary_range(self):
+        """Return a human readable salary range"""
+        if self.salary_min is not None and self.salary_max is not None:
+            return f"${self.salary_min:,.0f} - ${self.salary_max:,.0f}"
+        if self.salary_min is not None:
+            return f"From ${self.salary_min:,.0f}"
+        if self.salary_max is not None:
+            return f"Up to ${self.salary_max:,.0f}"
+        return "Salary not specified"
@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class JobCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the job list.
+    Pages seek on (created_at, id) instead of using OFFSET, so deep
+    pages cost the same as the first one.
+    """
+    page_size = 20
+    ordering = ('-created_at', '-id')
@@ -20,6 +20,9 @@ class JobListSerializer(serializers.ModelSerializer):
         ]
     
     def get_application_count(self, obj):
+        # Use the count annotated by the view when available to avoid a query per job
+        if hasattr(obj, 'application_count'):
+            return obj.application_count
         return obj.applications.count()
     
     def get_days_posted(self, obj):
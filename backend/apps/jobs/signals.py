@@ -0,0 +1,32 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Job
+
+# Bumped whenever jobs, applications or categories change so cached
+# featured payloads are invalidated without having to track and delete
+# every cached key
+FEATURED_JOBS_VERSION_KEY = 'jobs:featured:ver'
+
+
+def get_featured_jobs_version():
+    return cache.get(FEATURED_JOBS_VERSION_KEY, 0)
+
+
+def bump_featured_jobs_version():
+    try:
+        cache.incr(FEATURED_JOBS_VERSION_KEY)
+    except ValueError:
+        # Key missing or evicted, start a new version sequence
+        cache.set(FEATURED_JOBS_VERSION_KEY, 1, None)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender='applications.Application')
+@receiver(post_delete, sender='applications.Application')
+@receiver(post_save, sender='categories.Category')
+@receiver(post_delete, sender='categories.Category')
+def invalidate_featured_jobs(sender, **kwargs):
+    bump_featured_jobs_version()
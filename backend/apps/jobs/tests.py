@@ -6,6 +6,7 @@ from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from decimal import Decimal
 from .models import Job
+from apps.applications.models import Application
 from apps.categories.models import Category
 from apps.users.models import UserProfile
 
@@ -15,17 +16,22 @@ User = get_user_model()
 class JobModelTest(TestCase):
     """Test cases for Job model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.category = Category.objects.create(
+        cls.category = Category.objects.create(
             name='Technology',
             description='Tech jobs'
         )
-        self.job_data = {
+
+    @property
+    def job_data(self):
+        """Fresh job kwargs for each use, so tests can mutate them"""
+        return {
             'title': 'Software Engineer',
             'description': 'Looking for a skilled software engineer',
             'company_name': 'Tech Corp',
@@ -69,39 +75,58 @@ class JobModelTest(TestCase):
         self.assertEqual(jobs[0], job2)  # Latest first
         self.assertEqual(jobs[1], job1)
 
-    def test_job_salary_range_property(self):
-        """Test salary range property"""
-        job = Job.objects.create(**self.job_data)
-        expected_range = "$80,000 - $120,000"
-        self.assertEqual(job.salary_range, expected_range)
-
-    def test_job_without_salary(self):
-        """Test job without salary information"""
-        job_data = self.job_data.copy()
-        job_data['salary_min'] = None
-        job_data['salary_max'] = None
-        job = Job.objects.create(**job_data)
-        self.assertEqual(job.salary_range, "Salary not specified")
+    def test_job_salary_range(self):
+        """Test salary range property for full, partial and missing salaries"""
+        cases = [
+            (Decimal('80000.00'), Decimal('120000.00'), "$80,000 - $120,000"),
+            (None, None, "Salary not specified"),
+            (Decimal('50000.00'), None, "From $50,000"),
+            (None, Decimal('90000.00'), "Up to $90,000"),
+        ]
+        for salary_min, salary_max, expected_range in cases:
+            with self.subTest(salary_min=salary_min, salary_max=salary_max):
+                job_data = self.job_data.copy()
+                job_data['salary_min'] = salary_min
+                job_data['salary_max'] = salary_max
+                job = Job.objects.create(**job_data)
+                self.assertEqual(job.salary_range, expected_range)
 
 
 class JobAPITest(APITestCase):
     """Test cases for Job API endpoints"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.profile = UserProfile.objects.create(
-            user=self.user,
+        cls.profile = UserProfile.objects.create(
+            user=cls.user,
             bio='Test user bio'
         )
-        self.category = Category.objects.create(
+        cls.category = Category.objects.create(
             name='Technology',
             description='Tech jobs'
         )
-        self.job_data = {
+        cls.job = Job.objects.create(
+            title='Existing Job',
+            description='Test job',
+            company_name='Test Company',
+            location='Test Location',
+            employment_type='full_time',
+            experience_level='junior',
+            category=cls.category,
+            posted_by=cls.user
+        )
+        # The user never changes, so sign one token for the whole class
+        cls._auth_header = f'Bearer {RefreshToken.for_user(cls.user).access_token}'
+
+    @property
+    def job_data(self):
+        """Fresh job payload for each use, so tests can mutate it"""
+        return {
             'title': 'Software Engineer',
             'description': 'Looking for a skilled software engineer',
             'company_name': 'Tech Corp',
@@ -112,22 +137,10 @@ class JobAPITest(APITestCase):
             'salary_max': '120000.00',
             'category': self.category.id
         }
-        self.job = Job.objects.create(
-            title='Existing Job',
-            description='Test job',
-            company_name='Test Company',
-            location='Test Location',
-            employment_type='full_time',
-            experience_level='junior',
-            category=self.category,
-            posted_by=self.user
-        )
 
     def get_auth_header(self):
         """Get authorization header for authenticated requests"""
-        refresh = RefreshToken.for_user(self.user)
-        access_token = str(refresh.access_token)
-        return f'Bearer {access_token}'
+        return self._auth_header
 
     def test_job_list_unauthenticated(self):
         """Test job list endpoint without authentication"""
@@ -136,6 +149,94 @@ class JobAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('results', response.data)
 
+    def test_job_list_not_modified(self):
+        """Test job list returns 304 when the client ETag is current"""
+        url = reverse('job-list')
+        response = self.client.get(url)
+        etag = response['ETag']
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.job.title = 'Renamed Job'
+        self.job.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_job_list_etag_tracks_applications_and_categories(self):
+        """Test a new application or a category edit invalidates the list ETag"""
+        url = reverse('job-list')
+        etag = self.client.get(url)['ETag']
+        
+        Application.objects.create(job=self.job, applicant=self.user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['application_count'], 1)
+        etag = response['ETag']
+        
+        self.category.name = 'Engineering'
+        self.category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['category']['name'], 'Engineering')
+
+    def test_job_list_cursor_pagination(self):
+        """Test following the job list cursor visits every job once"""
+        Job.objects.bulk_create([
+            Job(
+                title=f'Job {i}', description='Test job', company_name='Test Company',
+                location='Test Location', category=self.category, posted_by=self.user
+            )
+            for i in range(20)
+        ])
+        
+        seen = []
+        url = reverse('job-list')
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(job['id'] for job in response.data['results'])
+            url = response.data['next']
+        
+        self.assertEqual(len(seen), 21)
+        self.assertEqual(len(set(seen)), 21)
+
+    def test_job_list_pagination_with_ordering(self):
+        """Test every page is reachable, in order, for each ?ordering= value"""
+        Job.objects.bulk_create([
+            Job(
+                title=f'Job {i}', description='Test job', company_name='Test Company',
+                location='Test Location', category=self.category, posted_by=self.user,
+                # Nullable, repeated salaries must not strand or reorder rows
+                salary_min=None if i % 3 == 0 else Decimal(50000 + i % 4 * 1000),
+                salary_max=None if i % 5 == 0 else Decimal(90000 + i % 3 * 1000),
+            )
+            for i in range(30)
+        ])
+        jobs = list(Job.objects.values('id', 'created_at', 'salary_min', 'salary_max'))
+        
+        for ordering in ['created_at', '-created_at', 'salary_min', '-salary_max']:
+            with self.subTest(ordering=ordering):
+                field = ordering.lstrip('-')
+                # PostgreSQL sorts NULLs last ascending and first descending
+                expected = [job['id'] for job in sorted(
+                    jobs,
+                    key=lambda job: (job[field] is None, job[field] or 0, job['id']),
+                    reverse=ordering.startswith('-'),
+                )]
+                
+                seen = []
+                response = self.client.get(reverse('job-list'), {'ordering': ordering})
+                self.assertEqual('count' in response.data, field != 'created_at')
+                while True:
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                    seen.extend(job['id'] for job in response.data['results'])
+                    if not response.data['next']:
+                        break
+                    response = self.client.get(response.data['next'])
+                
+                self.assertEqual(seen, expected)
+
     def test_job_detail_unauthenticated(self):
         """Test job detail endpoint without authentication"""
         url = reverse('job-detail', kwargs={'pk': self.job.pk})
@@ -174,35 +275,71 @@ class JobAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Job.objects.filter(pk=self.job.pk).exists())
 
-    def test_job_filtering_by_employment_type(self):
-        """Test filtering jobs by employment type"""
-        url = reverse('job-list')
-        response = self.client.get(url, {'employment_type': 'full_time'})
+    def test_my_jobs(self):
+        """Test my_jobs returns the owner's jobs as flat rows"""
+        url = reverse('job-my-jobs')
+        self.client.credentials(HTTP_AUTHORIZATION=self.get_auth_header())
+        response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        for job in response.data['results']:
-            self.assertEqual(job['employment_type'], 'full_time')
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['title'], 'Existing Job')
+        self.assertEqual(response.data[0]['category_name'], 'Technology')
+        self.assertEqual(response.data[0]['application_count'], 0)
 
-    def test_job_filtering_by_category(self):
-        """Test filtering jobs by category"""
+    def test_job_list_queries(self):
+        """Test filtering, searching and ordering the job list"""
         url = reverse('job-list')
-        response = self.client.get(url, {'category': self.category.id})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        for job in response.data['results']:
-            self.assertEqual(job['category']['id'], self.category.id)
+        cases = [
+            ('by_employment', {'employment_type': 'full_time'},
+             lambda results: all(job['employment_type'] == 'full_time' for job in results)),
+            ('by_category', {'category': self.category.id},
+             lambda results: all(job['category']['id'] == self.category.id for job in results)),
+            # Results should contain jobs with 'engineer' in title or description
+            ('search', {'search': 'engineer'}, lambda results: True),
+            # Full-text search matches stemmed words in any indexed column
+            ('search_match', {'search': 'companies'},
+             lambda results: [job['title'] for job in results] == ['Existing Job']),
+            # Results should be ordered by created_at descending
+            ('ordering', {'ordering': '-created_at'},
+             lambda results: [job['created_at'] for job in results]
+             == sorted((job['created_at'] for job in results), reverse=True)),
+        ]
+        for case_id, query, check in cases:
+            with self.subTest(case_id):
+                response = self.client.get(url, query)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertTrue(check(response.data['results']))
 
-    def test_job_search(self):
-        """Test searching jobs"""
-        url = reverse('job-list')
-        response = self.client.get(url, {'search': 'engineer'})
+    def test_featured_jobs_cache_invalidated_on_change(self):
+        """Test featured jobs are refreshed after a job is created"""
+        url = reverse('job-featured')
+        response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Results should contain jobs with 'engineer' in title or description
+        self.assertEqual(len(response.data), 1)
+        
+        Job.objects.create(
+            title='Another Job',
+            description='Test job',
+            company_name='Test Company',
+            location='Test Location',
+            category=self.category,
+            posted_by=self.user
+        )
+        response = self.client.get(url)
+        self.assertEqual(len(response.data), 2)
 
-    def test_job_ordering(self):
-        """Test job ordering"""
-        url = reverse('job-list')
-        response = self.client.get(url, {'ordering': '-created_at'})
+    def test_job_stats(self):
+        """Test job statistics endpoint"""
+        url = reverse('job-stats')
+        response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Check if results are ordered by created_at descending
+        self.assertEqual(response.data['total_jobs'], 1)
+        self.assertEqual(response.data['total_applications'], 0)
+        self.assertEqual(
+            response.data['employment_type_distribution'],
+            [{'employment_type': 'full_time', 'count': 1}]
+        )
+        self.assertEqual(response.data['average_salary_by_level'], [])
 
     def test_invalid_job_data(self):
         """Test creating job with invalid data"""
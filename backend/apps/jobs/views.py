@@ -1,18 +1,61 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters import rest_framework as filters
-from django.db.models import Q
+from django.db.models import F, Q, Max, Count, Avg, Sum, Value, DateTimeField
+from django.db.models.functions import Extract
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from django.utils.http import http_date, parse_etags
 
+from apps.applications.models import Application
+from apps.categories.models import Category
+from apps.applications.serializers import ApplicationListSerializer
 from .models import Job
+from .pagination import JobCursorPagination
+from .signals import get_featured_jobs_version
 from .serializers import (
     JobListSerializer, JobDetailSerializer, 
     JobCreateSerializer, JobUpdateSerializer
 )
 
 
+FEATURED_JOBS_CACHE_TIMEOUT = 60
+
+# PostgreSQL only: builds the whole stats payload as JSON in one query
+JOB_STATS_SQL = """
+    WITH active_jobs AS (
+        SELECT employment_type, experience_level, salary_min
+        FROM {job_table}
+        WHERE is_active
+    ),
+    employment AS (
+        SELECT employment_type, count(*) AS count
+        FROM active_jobs
+        GROUP BY employment_type
+    ),
+    salary AS (
+        SELECT experience_level, avg(salary_min) AS avg_salary
+        FROM active_jobs
+        WHERE salary_min IS NOT NULL
+        GROUP BY experience_level
+    )
+    SELECT json_build_object(
+        'total_jobs', (SELECT count(*) FROM active_jobs),
+        'total_applications', (SELECT count(*) FROM {application_table}),
+        'employment_type_distribution',
+            COALESCE((SELECT json_agg(employment) FROM employment), '[]'::json),
+        'average_salary_by_level',
+            COALESCE((SELECT json_agg(salary) FROM salary), '[]'::json)
+    )
+"""
+
+
 class JobFilter(filters.FilterSet):
     """
     Custom filter for Job model
@@ -23,7 +66,7 @@ class JobFilter(filters.FilterSet):
     company = filters.CharFilter(field_name='company_name', lookup_expr='icontains')
     employment_type = filters.ChoiceFilter(choices=Job.EMPLOYMENT_TYPE_CHOICES)
     experience_level = filters.ChoiceFilter(choices=Job.EXPERIENCE_LEVEL_CHOICES)
-    category = filters.NumberFilter(field_name='category__id')
+    category = filters.NumberFilter(field_name='category_id')
     
     class Meta:
         model = Job
@@ -31,51 +74,141 @@ class JobFilter(filters.FilterSet):
                  'employment_type', 'experience_level', 'category']
 
 
+class JobSearchFilter(SearchFilter):
+    """
+    Full-text search on the GIN indexed search_vector column
+    instead of ILIKE scans over every text field
+    """
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+        
+        query = SearchQuery(terms, config='english', search_type='websearch')
+        return queryset.filter(search_vector=query)
+
+
+class JobOrderingFilter(OrderingFilter):
+    """
+    Ordering filter that appends an id tiebreak in the same direction as
+    the requested ordering, so rows sharing a value keep a stable order
+    between pages
+    """
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering and not any(field.lstrip('-') == 'id' for field in ordering):
+            ordering = [*ordering, '-id' if ordering[0].startswith('-') else 'id']
+        return ordering
+
+
 class JobViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing job postings
     """
     queryset = Job.objects.filter(is_active=True).select_related('category', 'posted_by')
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, JobOrderingFilter]
     filterset_class = JobFilter
-    search_fields = ['title', 'description', 'company_name', 'location', 'requirements']
+    pagination_class = JobCursorPagination
     ordering_fields = ['created_at', 'application_deadline', 'salary_min', 'salary_max']
-    ordering = ['-created_at']
+    # The cursor seeks on the first ordering field, which only works for the
+    # non-null created_at; nullable salary/deadline columns would strand rows
+    # past the first NULL, so those orderings use numbered pages instead
+    cursor_ordering_fields = {'created_at', 'id'}
+    ordering = ['-created_at', '-id']
+    
+    serializer_action_classes = {
+        'list': JobListSerializer,
+        'create': JobCreateSerializer,
+        'update': JobUpdateSerializer,
+        'partial_update': JobUpdateSerializer,
+    }
+    # Only authenticated users can create jobs.
+    # Only job owners can update/delete their jobs.
+    permission_action_classes = {
+        'create': [permissions.IsAuthenticated],
+        'update': [permissions.IsAuthenticated],
+        'partial_update': [permissions.IsAuthenticated],
+        'destroy': [permissions.IsAuthenticated],
+    }
+    
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            ordering = JobOrderingFilter().get_ordering(self.request, self.get_queryset(), self)
+            if all(field.lstrip('-') in self.cursor_ordering_fields for field in ordering):
+                self._paginator = JobCursorPagination()
+            else:
+                self._paginator = PageNumberPagination()
+        return self._paginator
     
     def get_serializer_class(self):
-        if self.action == 'list':
-            return JobListSerializer
-        elif self.action == 'create':
-            return JobCreateSerializer
-        elif self.action in ['update', 'partial_update']:
-            return JobUpdateSerializer
-        return JobDetailSerializer
+        return self.serializer_action_classes.get(self.action, JobDetailSerializer)
     
     def get_permissions(self):
-        """
-        Only authenticated users can create jobs.
-        Only job owners can update/delete their jobs.
-        """
-        if self.action == 'create':
-            permission_classes = [permissions.IsAuthenticated]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            permission_classes = [permissions.IsAuthenticated]
-        else:
-            permission_classes = [permissions.AllowAny]
-        
+        permission_classes = self.permission_action_classes.get(
+            self.action, [permissions.AllowAny]
+        )
         return [permission() for permission in permission_classes]
     
     def get_queryset(self):
         queryset = super().get_queryset()
         
-        # If user wants to see their own jobs (including inactive ones)
-        if self.action == 'my_jobs':
-            if self.request.user.is_authenticated:
-                queryset = Job.objects.filter(posted_by=self.request.user).select_related('category')
+        if self.action == 'list':
+            queryset = queryset.annotate(application_count=Count('applications'))
         
         return queryset
     
+    def list(self, request, *args, **kwargs):
+        """
+        List jobs with conditional GET support.
+        The ETag is built from database state only, so every worker agrees
+        on it: it changes whenever an active job, an application or a
+        category is added, edited or removed, or any job's days_posted
+        ticks over, so revalidating clients get a 304 without the list
+        being rebuilt.
+        """
+        now = timezone.now()
+        state = Job.objects.filter(is_active=True).aggregate(
+            last_modified=Max('updated_at'),
+            count=Count('id'),
+            # Sum of every job's days_posted; grows whenever one of them does
+            days=Sum(Extract(Value(now, output_field=DateTimeField()) - F('created_at'), 'day')),
+        )
+        applications = Application.objects.aggregate(
+            last_modified=Max('updated_at'), count=Count('id')
+        )
+        categories = Category.objects.aggregate(
+            last_modified=Max('updated_at'), count=Count('id')
+        )
+        last_modified = state['last_modified']
+        
+        def stamp(value):
+            return int(value.timestamp() * 1_000_000) if value else 0
+        
+        etag = (f'W/"{stamp(last_modified)}-{state["count"]}-{state["days"] or 0}'
+                f'-{stamp(applications["last_modified"])}-{applications["count"]}'
+                f'-{stamp(categories["last_modified"])}-{categories["count"]}"')
+        
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+        
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+    
+    def get_object(self):
+        """
+        Fetch the job once per request, so the ownership checks below
+        don't cost a second query when the parent update/destroy runs.
+        """
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
+    
     def perform_create(self, serializer):
         serializer.save(posted_by=self.request.user)
     
@@ -108,9 +241,15 @@ class JobViewSet(viewsets.ModelViewSet):
         """
         Get jobs posted by the current user
         """
-        jobs = Job.objects.filter(posted_by=request.user).select_related('category')
-        serializer = JobListSerializer(jobs, many=True, context={'request': request})
-        return Response(serializer.data)
+        # Flat dashboard rows straight from values(); no model instances
+        # or nested serializers are built for this endpoint
+        jobs = Job.objects.filter(posted_by=request.user).values(
+            'id', 'title', 'company_name', 'location', 'is_active',
+            'application_deadline', 'created_at',
+            category_name=F('category__name'),
+            application_count=Count('applications'),
+        ).order_by('-created_at')
+        return Response(list(jobs))
     
     @action(detail=True, methods=['get'])
     def applications(self, request, pk=None):
@@ -124,9 +263,6 @@ class JobViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        from apps.applications.models import Application
-        from apps.applications.serializers import ApplicationListSerializer
-        
         applications = Application.objects.filter(job=job).select_related('applicant')
         serializer = ApplicationListSerializer(applications, many=True, context={'request': request})
         return Response(serializer.data)
@@ -136,22 +272,32 @@ class JobViewSet(viewsets.ModelViewSet):
         """
         Get featured jobs (most recent or most applied to)
         """
-        from django.db.models import Count
+        cache_key = f"jobs:featured:v{get_featured_jobs_version()}"
+        data = cache.get(cache_key)
+        if data is None:
+            jobs = self.get_queryset().annotate(
+                application_count=Count('applications')
+            ).order_by('-application_count', '-created_at')[:10]
+            
+            serializer = JobListSerializer(jobs, many=True, context={'request': request})
+            data = serializer.data
+            cache.set(cache_key, data, FEATURED_JOBS_CACHE_TIMEOUT)
         
-        jobs = self.get_queryset().annotate(
-            application_count=Count('applications')
-        ).order_by('-application_count', '-created_at')[:10]
-        
-        serializer = JobListSerializer(jobs, many=True, context={'request': request})
-        return Response(serializer.data)
+        return Response(data)
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """
         Get job statistics
         """
-        from django.db.models import Count, Avg
-        from apps.applications.models import Application
+        if connection.vendor == 'postgresql':
+            # Collapse the four aggregates into a single round-trip
+            with connection.cursor() as cursor:
+                cursor.execute(JOB_STATS_SQL.format(
+                    job_table=Job._meta.db_table,
+                    application_table=Application._meta.db_table,
+                ))
+                return Response(cursor.fetchone()[0])
         
         total_jobs = self.get_queryset().count()
         total_applications = Application.objects.count()
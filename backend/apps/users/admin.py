@@ -8,9 +8,11 @@ class UserProfileAdmin(admin.ModelAdmin):
         'experience_level', 'is_profile_public', 'is_available_for_hire', 
         'created_at', 'updated_at'
     ]
+    # city and country are free text; filter them through search instead
+    # of rendering a SELECT DISTINCT over the whole table on every page
     list_filter = [
         'experience_level', 'gender', 'is_profile_public', 
-        'is_available_for_hire', 'city', 'country', 'created_at'
+        'is_available_for_hire', 'created_at'
     ]
     search_fields = [
         'user__username', 'user__email', 'bio', 'job_title', 
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
+
+    def ready(self):
+        from django.core import checks
+        from utils.encryption import check_hardware_aes
+        from . import signals  # noqa: F401
+        
+        checks.register(check_hardware_aes)
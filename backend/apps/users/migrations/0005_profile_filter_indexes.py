@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:29
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_profile_location_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['is_profile_public', 'is_available_for_hire', '-updated_at'], name='profile_public_available_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['experience_level'], name='profile_experience_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['expected_salary_min', 'expected_salary_max'], name='profile_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('skills'), name='gin_trgm_ops'), name='profile_skills_trgm_idx'),
+        ),
+    ]
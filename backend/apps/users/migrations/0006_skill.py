@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_profile_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfileSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.userprofile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.skill')),
+            ],
+            options={
+                'unique_together': {('profile', 'skill')},
+            },
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='skill_set',
+            field=models.ManyToManyField(blank=True, related_name='profiles', through='users.ProfileSkill', to='users.skill'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+def populate_skills(apps, schema_editor):
+    """Split the existing comma separated skills into Skill rows"""
+    UserProfile = apps.get_model('users', 'UserProfile')
+    Skill = apps.get_model('users', 'Skill')
+    ProfileSkill = apps.get_model('users', 'ProfileSkill')
+    
+    profile_names = {}
+    for profile_id, skills in UserProfile.objects.exclude(skills='').values_list('id', 'skills'):
+        names = {skill.strip().lower()[:100] for skill in skills.split(',') if skill.strip()}
+        if names:
+            profile_names[profile_id] = names
+    
+    all_names = set().union(*profile_names.values())
+    Skill.objects.bulk_create([Skill(name=name) for name in all_names], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.filter(name__in=all_names).values_list('name', 'id'))
+    
+    ProfileSkill.objects.bulk_create(
+        [
+            ProfileSkill(profile_id=profile_id, skill_id=skill_ids[name])
+            for profile_id, names in profile_names.items()
+            for name in names
+        ],
+        ignore_conflicts=True,
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_skill'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_skills, migrations.RunPython.noop),
+    ]
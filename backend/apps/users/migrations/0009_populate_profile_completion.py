@@ -0,0 +1,31 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+# Frozen copy of PROFILE_COMPLETION_FIELDS at the time of this migration
+COMPLETION_FIELDS = ('bio', 'phone_number', 'job_title', 'skills', 'education', 'profile_image')
+
+
+def populate_profile_completion(apps, schema_editor):
+    """Fill profile_completion for existing profiles, one UPDATE per distinct value"""
+    UserProfile = apps.get_model('users', 'UserProfile')
+    
+    ids_by_completion = defaultdict(list)
+    for profile_id, *values in UserProfile.objects.values_list('id', *COMPLETION_FIELDS).iterator():
+        completed = sum(1 for value in values if value)
+        ids_by_completion[completed * 100 // len(COMPLETION_FIELDS)].append(profile_id)
+    
+    for completion, ids in ids_by_completion.items():
+        if completion:
+            UserProfile.objects.filter(id__in=ids).update(profile_completion=completion)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_userprofile_profile_completion'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_profile_completion, migrations.RunPython.noop),
+    ]
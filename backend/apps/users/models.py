@@ -1,10 +1,32 @@
 from django.db import models
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 from django.utils import timezone
+from django.utils.functional import cached_property
 from PIL import Image
+import logging
 import os
+import re
+from io import BytesIO
+from tempfile import NamedTemporaryFile
 from utils.encryption import EncryptedFieldMixin
 
+logger = logging.getLogger(__name__)
+
+# Profile images are shrunk to fit inside this box
+PROFILE_IMAGE_MAX_SIZE = (500, 500)
+PROGRESSIVE_JPEG_MIN_BYTES = 200 * 1024
+
+# Fields counted by profile_completion, each worth an equal share
+PROFILE_COMPLETION_FIELDS = (
+    'bio', 'phone_number', 'job_title', 'skills', 'education', 'profile_image'
+)
+
+# One comma separated skill, without surrounding whitespace
+_SKILL_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
 
 def user_profile_image_path(instance, filename):
     """Generate file path for user profile images"""
@@ -13,6 +35,62 @@ def user_profile_image_path(instance, filename):
     return os.path.join('profiles', filename)
 
 
+def _fits_profile_image_size(img):
+    return img.width <= PROFILE_IMAGE_MAX_SIZE[0] and img.height <= PROFILE_IMAGE_MAX_SIZE[1]
+
+
+def _save_profile_thumbnail(img, out, source_bytes):
+    """Shrink an open image to PROFILE_IMAGE_MAX_SIZE and write it to out"""
+    image_format = img.format
+    save_options = {'optimize': True, 'quality': 85}
+    if image_format == 'JPEG':
+        # Have libjpeg-turbo decode at a reduced DCT scale (1/2, 1/4 or 1/8)
+        # so a large photo is never materialised at full resolution
+        img.draft(None, PROFILE_IMAGE_MAX_SIZE)
+        save_options['subsampling'] = '4:2:2'
+        # Progressive encoding only pays off for larger uploads
+        save_options['progressive'] = source_bytes > PROGRESSIVE_JPEG_MIN_BYTES
+    img.thumbnail(PROFILE_IMAGE_MAX_SIZE, Image.Resampling.LANCZOS)
+    img.save(out, format=image_format, **save_options)
+
+
+def resize_profile_image(path):
+    """
+    Shrink a stored profile image in place to fit PROFILE_IMAGE_MAX_SIZE.
+    The result is written to a temporary file and swapped in, so readers
+    never see a half written image.
+    """
+    with Image.open(path) as img:
+        if _fits_profile_image_size(img):
+            return
+        
+        with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as tmp:
+            try:
+                _save_profile_thumbnail(img, tmp, os.path.getsize(path))
+                # NamedTemporaryFile is created 0600; match a normal upload
+                os.chmod(tmp.name, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+            except Exception:
+                os.unlink(tmp.name)
+                raise
+    os.replace(tmp.name, path)
+
+
+def resize_uploaded_image(upload):
+    """
+    Shrink an uploaded image before it is stored.
+    Returns a ContentFile with the result, or None if it already fits.
+    """
+    upload.seek(0)
+    with Image.open(upload) as img:
+        if _fits_profile_image_size(img):
+            upload.seek(0)
+            return None
+        
+        buffer = BytesIO()
+        _save_profile_thumbnail(img, buffer, upload.size)
+    return ContentFile(buffer.getvalue(), name=upload.name)
+
+
 def user_resume_path(instance, filename):
     """Generate file path for user resumes"""
     ext = filename.split('.')[-1]
@@ -83,6 +161,13 @@ class UserProfile(EncryptedFieldMixin, models.Model):
         blank=True, 
         help_text="Comma-separated list of skills"
     )
+    # Normalised copy of skills for indexed filtering, kept in sync on save
+    skill_set = models.ManyToManyField(
+        'Skill',
+        through='ProfileSkill',
+        related_name='profiles',
+        blank=True
+    )
     education = models.TextField(blank=True, help_text="Educational background")
     certifications = models.TextField(blank=True, help_text="Professional certifications")
     
@@ -115,6 +200,9 @@ class UserProfile(EncryptedFieldMixin, models.Model):
         help_text="Available for job opportunities"
     )
     
+    # Percentage of PROFILE_COMPLETION_FIELDS filled in, kept up to date on save
+    profile_completion = models.PositiveSmallIntegerField(default=0, editable=False)
+    
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -123,40 +211,110 @@ class UserProfile(EncryptedFieldMixin, models.Model):
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
         ordering = ['-updated_at']
+        indexes = [
+            # Default list and available_candidates path
+            models.Index(
+                fields=['is_profile_public', 'is_available_for_hire', '-updated_at'],
+                name='profile_public_available_idx',
+            ),
+            models.Index(fields=['experience_level'], name='profile_experience_idx'),
+            models.Index(
+                fields=['expected_salary_min', 'expected_salary_max'],
+                name='profile_salary_idx',
+            ),
+            # Filters and admin search use icontains, which PostgreSQL runs as UPPER(col) LIKE
+            GinIndex(OpClass(Upper('city'), name='gin_trgm_ops'), name='profile_city_trgm_idx'),
+            GinIndex(OpClass(Upper('country'), name='gin_trgm_ops'), name='profile_country_trgm_idx'),
+            GinIndex(OpClass(Upper('skills'), name='gin_trgm_ops'), name='profile_skills_trgm_idx'),
+        ]
+    
+    # skills and profile_image name as last read from or written to the
+    # database; None when unsaved
+    _loaded_skills = None
+    _loaded_profile_image = None
     
     def __str__(self):
         return f"{self.user.username}'s Profile"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_skills = instance.__dict__.get('skills')
+        instance._loaded_profile_image = instance.__dict__.get('profile_image')
+        return instance
+    
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._loaded_skills = self.__dict__.get('skills')
+        image = self.__dict__.get('profile_image')
+        self._loaded_profile_image = getattr(image, 'name', image)
+    
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
+        # skills may have changed since skills_list was cached
+        self.__dict__.pop('skills_list', None)
         
-        # Resize profile image if it's too large
-        if self.profile_image:
+        # Shrink a fresh upload in memory so it is written to storage once,
+        # instead of being stored, read back and rewritten
+        self._profile_image_resized = False
+        self._profile_image_changed = 'profile_image' in self.__dict__ and (
+            not self.profile_image._committed
+            or (self.profile_image.name or '') != (self._loaded_profile_image or '')
+        )
+        if self.profile_image and not self.profile_image._committed:
             try:
-                img = Image.open(self.profile_image.path)
-                if img.height > 500 or img.width > 500:
-                    img.thumbnail((500, 500), Image.Resampling.LANCZOS)
-                    img.save(self.profile_image.path, optimize=True, quality=85)
+                resized = resize_uploaded_image(self.profile_image.file)
+                if resized is not None:
+                    self.profile_image = resized
+                self._profile_image_resized = True
             except Exception as e:
-                # Log the error but don't fail the save
-                print(f"Error resizing image: {e}")
+                # Leave it to the background task rather than failing the save
+                logger.error(f"Error resizing uploaded image: {e}")
+        
+        self.profile_completion = self.compute_profile_completion()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not set(update_fields).isdisjoint(PROFILE_COMPLETION_FIELDS):
+            kwargs['update_fields'] = {*update_fields, 'profile_completion'}
+        
+        # Only touch skill_set when the skills text actually changed
+        skills_changed = (
+            'skills' in self.__dict__
+            and (self.skills or '') != (self._loaded_skills or '')
+        )
+        
+        super().save(*args, **kwargs)
+        
+        if skills_changed and (update_fields is None or 'skills' in update_fields):
+            self.sync_skills()
+            self._loaded_skills = self.skills
+        if self._profile_image_changed and (update_fields is None or 'profile_image' in update_fields):
+            self._loaded_profile_image = self.profile_image.name
+        # Images that were not resized above are handled by a background task, see signals.py
+    
+    def compute_profile_completion(self):
+        """Percentage of PROFILE_COMPLETION_FIELDS that are filled in"""
+        completed = sum(1 for field in PROFILE_COMPLETION_FIELDS if getattr(self, field))
+        return completed * 100 // len(PROFILE_COMPLETION_FIELDS)
     
     @property
     def age(self):
         """Calculate age from date of birth"""
+        return self.age_on(timezone.now().date())
+    
+    def age_on(self, today):
+        """Age in whole years on the given date"""
         if self.date_of_birth:
-            today = timezone.now().date()
-            return today.year - self.date_of_birth.year - (
-                (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
-            )
+            dob = self.date_of_birth
+            # Dates as YYYYMMDD integers: whole years are the ten-thousands difference
+            return (
+                (today.year * 10000 + today.month * 100 + today.day)
+                - (dob.year * 10000 + dob.month * 100 + dob.day)
+            ) // 10000
         return None
     
-    @property
+    @cached_property
     def skills_list(self):
         """Return skills as a list"""
-        if self.skills:
-            return [skill.strip() for skill in self.skills.split(',') if skill.strip()]
-        return []
+        return _SKILL_RE.findall(self.skills or '')
     
     @property
     def application_count(self):
@@ -167,3 +325,34 @@ class UserProfile(EncryptedFieldMixin, models.Model):
     def jobs_posted_count(self):
         """Get total number of jobs posted by this user"""
         return self.user.posted_jobs.count()
+    
+    def sync_skills(self):
+        """Mirror the comma separated skills text into skill_set"""
+        names = {Skill.normalize(skill) for skill in self.skills_list}
+        Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+        self.skill_set.set(Skill.objects.filter(name__in=names))
+
+
+class Skill(models.Model):
+    """A distinct skill name, stored lowercased"""
+    name = models.CharField(max_length=100, unique=True)
+    
+    class Meta:
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+    
+    @staticmethod
+    def normalize(name):
+        """Return the lookup form of a skill name"""
+        return name.strip().lower()[:100]
+
+
+class ProfileSkill(models.Model):
+    """Link between a user profile and one of its skills"""
+    profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE)
+    
+    class Meta:
+        unique_together = ['profile', 'skill']
@@ -1,13 +1,117 @@
+from copy import deepcopy
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Count, Q
 from .models import UserProfile
-from utils.encryption import decrypt_data
-from django.conf import settings
+from utils.encryption import try_decrypt, decrypt_many, DecryptionError
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 User = get_user_model()
 
+# Accepted upload types, with the leading bytes each format must start with
+# so a client-supplied content type alone is not trusted
+_IMAGE_TYPES = frozenset({'image/jpeg', 'image/png', 'image/jpg'})
+_IMAGE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n')
+_RESUME_TYPES = frozenset({
+    'application/pdf', 'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+})
+# PDF, OLE2 (legacy .doc) and ZIP (.docx)
+_RESUME_SIGNATURES = (b'%PDF-', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', b'PK\x03\x04')
+
+
+def _has_signature(upload, signatures):
+    """Check the upload's first bytes against known file signatures"""
+    upload.seek(0)
+    header = upload.read(8)
+    upload.seek(0)
+    return header.startswith(signatures)
+
+
+class CachedFieldsSerializerMixin:
+    """
+    Build the declared and model fields once per serializer class.
+    Each instance gets a deep copy, so binding and nested serializers
+    stay per instance.
+    """
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = self.__class__
+        fields = CachedFieldsSerializerMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsSerializerMixin._fields_cache[cls] = fields
+        return deepcopy(fields)
+
+
+class AbsoluteURLSerializerMixin:
+    """
+    Resolve the request scheme and host once per serializer so media URLs
+    are built by concatenation instead of build_absolute_uri per row.
+    Both are read on first use, once a nested serializer can see its
+    parent's context.
+    """
+    @cached_property
+    def _request(self):
+        return self.context.get('request')
+    
+    @cached_property
+    def _base_url(self):
+        if self._request is None:
+            return None
+        return f"{self._request.scheme}://{self._request.get_host()}"
+    
+    def build_absolute_url(self, url):
+        """Return an absolute URL for a storage URL, or None without a request"""
+        if self._base_url is None:
+            return None
+        if url.startswith('/') and not url.startswith('//'):
+            return f"{self._base_url}{url}"
+        # Storage already returned a full URL (or a protocol-relative one)
+        return self._request.build_absolute_uri(url)
+
+
+class ProfileAgeSerializerMixin:
+    """
+    Read today's date once per serializer so a list page computes
+    every profile's age against the same date.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._today = timezone.now().date()
+    
+    def get_age(self, obj):
+        return obj.age_on(self._today)
+
+
+class FullNameBatchListSerializer(serializers.ListSerializer):
+    """
+    Decrypt the full names of a whole page in one batch.
+    UserBasicSerializer.get_full_name reads them from the shared context.
+    """
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        # Items are either users or profiles pointing at one
+        users = [getattr(item, 'user', item) for item in items]
+        encrypted = [(user.pk, user.full_name) for user in users if user.full_name]
+        
+        if encrypted:
+            try:
+                decrypted = decrypt_many([value for _, value in encrypted])
+            except DecryptionError:
+                # Rows fall back to decrypting one by one
+                decrypted = []
+            self.context['decrypted_full_names'] = {
+                pk: name for (pk, _), name in zip(encrypted, decrypted) if name
+            }
+        
+        return super().to_representation(items)
 
-class UserBasicSerializer(serializers.ModelSerializer):
+
+class UserBasicSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Basic user information (public view)"""
     full_name = serializers.SerializerMethodField()
     
@@ -15,25 +119,26 @@ class UserBasicSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username', 'email', 'full_name', 'date_joined']
         read_only_fields = ['id', 'username', 'date_joined']
+        list_serializer_class = FullNameBatchListSerializer
     
     def get_full_name(self, obj):
         """Decrypt and return full name"""
         if obj.full_name:
-            try:
-                decrypted = decrypt_data(obj.full_name, settings.ENCRYPTION_KEY)
-                return decrypted if decrypted else obj.full_name
-            except:
-                return obj.full_name
+            decrypted_full_names = self.context.get('decrypted_full_names', {})
+            if obj.pk in decrypted_full_names:
+                return decrypted_full_names[obj.pk]
+            # Corrupted values come back as None rather than as ciphertext
+            return try_decrypt(obj.full_name) or None
         return None
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(AbsoluteURLSerializerMixin, ProfileAgeSerializerMixin, CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Complete user profile serializer"""
     user = UserBasicSerializer(read_only=True)
-    age = serializers.ReadOnlyField()
+    age = serializers.SerializerMethodField()
     skills_list = serializers.ReadOnlyField()
-    application_count = serializers.ReadOnlyField()
-    jobs_posted_count = serializers.ReadOnlyField()
+    application_count = serializers.SerializerMethodField()
+    jobs_posted_count = serializers.SerializerMethodField()
     profile_image_url = serializers.SerializerMethodField()
     resume_url = serializers.SerializerMethodField()
     
@@ -59,20 +164,29 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
     
+    def get_application_count(self, obj):
+        # Use the counts annotated by the view when available to avoid a query per profile
+        if hasattr(obj, 'annotated_application_count'):
+            return obj.annotated_application_count
+        return obj.application_count
+    
+    def get_jobs_posted_count(self, obj):
+        if hasattr(obj, 'annotated_jobs_posted_count'):
+            return obj.annotated_jobs_posted_count
+        return obj.jobs_posted_count
+    
     def get_profile_image_url(self, obj):
         """Get full URL for profile image"""
-        request = self.context.get('request')
-        if obj.profile_image and request:
-            return request.build_absolute_uri(obj.profile_image.url)
+        if obj.profile_image:
+            return self.build_absolute_url(obj.profile_image.url)
         return None
     
     def get_resume_url(self, obj):
         """Get full URL for resume (only for profile owner)"""
-        request = self.context.get('request')
-        if obj.resume and request:
+        if obj.resume and self._request:
             # Only return resume URL to the profile owner
-            if request.user == obj.user:
-                return request.build_absolute_uri(obj.resume.url)
+            if self._request.user == obj.user:
+                return self.build_absolute_url(obj.resume.url)
         return None
     
     def get_phone_number_decrypted(self, obj):
@@ -88,7 +202,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return obj.get_decrypted_field('bio')
 
 
-class UserProfileUpdateSerializer(serializers.ModelSerializer):
+class UserProfileUpdateSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for updating user profile"""
     
     class Meta:
@@ -112,8 +226,7 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("Profile image size should not exceed 5MB")
             
             # Check file type
-            allowed_types = ['image/jpeg', 'image/png', 'image/jpg']
-            if value.content_type not in allowed_types:
+            if value.content_type not in _IMAGE_TYPES or not _has_signature(value, _IMAGE_SIGNATURES):
                 raise serializers.ValidationError("Only JPEG and PNG images are allowed")
         
         return value
@@ -126,9 +239,7 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("Resume file size should not exceed 10MB")
             
             # Check file type
-            allowed_types = ['application/pdf', 'application/msword', 
-                           'application/vnd.openxmlformats-officedocument.wordprocessingml.document']
-            if value.content_type not in allowed_types:
+            if value.content_type not in _RESUME_TYPES or not _has_signature(value, _RESUME_SIGNATURES):
                 raise serializers.ValidationError("Only PDF, DOC, and DOCX files are allowed")
         
         return value
@@ -158,10 +269,10 @@ class UserProfileUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class UserProfilePublicSerializer(serializers.ModelSerializer):
+class UserProfilePublicSerializer(AbsoluteURLSerializerMixin, ProfileAgeSerializerMixin, CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Public view of user profile (for employers)"""
     user = UserBasicSerializer(read_only=True)
-    age = serializers.ReadOnlyField()
+    age = serializers.SerializerMethodField()
     skills_list = serializers.ReadOnlyField()
     profile_image_url = serializers.SerializerMethodField()
     
@@ -175,12 +286,12 @@ class UserProfilePublicSerializer(serializers.ModelSerializer):
             'profile_image_url', 'linkedin_url', 'github_url', 'website_url',
             'is_available_for_hire'
         ]
+        list_serializer_class = FullNameBatchListSerializer
     
     def get_profile_image_url(self, obj):
         """Get full URL for profile image"""
-        request = self.context.get('request')
-        if obj.profile_image and request:
-            return request.build_absolute_uri(obj.profile_image.url)
+        if obj.profile_image:
+            return self.build_absolute_url(obj.profile_image.url)
         return None
 
 
@@ -261,29 +372,24 @@ class UserStatsSerializer(serializers.Serializer):
         user = profile.user
         
         # Application statistics
-        applications = user.applications.all()
-        total_applications = applications.count()
-        pending_applications = applications.filter(status='pending').count()
-        successful_applications = applications.filter(status__in=['shortlisted', 'hired']).count()
+        application_stats = user.applications.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            successful=Count('id', filter=Q(status__in=['shortlisted', 'hired'])),
+        )
         
         # Job posting statistics
-        jobs = user.posted_jobs.all()
-        total_jobs_posted = jobs.count()
-        active_jobs_posted = jobs.filter(is_active=True).count()
-        
-        # Profile completion percentage
-        profile_fields = [
-            profile.bio, profile.phone_number, profile.job_title,
-            profile.skills, profile.education, profile.profile_image
-        ]
-        completed_fields = sum(1 for field in profile_fields if field)
-        profile_completion_percentage = int((completed_fields / len(profile_fields)) * 100)
+        job_stats = user.posted_jobs.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+        )
         
         return {
-            'total_applications': total_applications,
-            'pending_applications': pending_applications,
-            'successful_applications': successful_applications,
-            'total_jobs_posted': total_jobs_posted,
-            'active_jobs_posted': active_jobs_posted,
-            'profile_completion_percentage': profile_completion_percentage
+            'total_applications': application_stats['total'],
+            'pending_applications': application_stats['pending'],
+            'successful_applications': application_stats['successful'],
+            'total_jobs_posted': job_stats['total'],
+            'active_jobs_posted': job_stats['active'],
+            # Maintained by UserProfile.save()
+            'profile_completion_percentage': profile.profile_completion
         }
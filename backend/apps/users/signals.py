@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import UserProfile
+from .tasks import resize_profile_image_task
+
+
+@receiver(post_save, sender=UserProfile)
+def queue_profile_image_resize(sender, instance, update_fields=None, **kwargs):
+    """Resize the profile image in the background once the save has committed"""
+    if not instance.profile_image or getattr(instance, '_profile_image_resized', False):
+        return
+    # Saves that leave the image alone don't need it resized again
+    if not getattr(instance, '_profile_image_changed', False):
+        return
+    if update_fields is not None and 'profile_image' not in update_fields:
+        return
+    
+    transaction.on_commit(lambda: resize_profile_image_task.delay(instance.pk))
@@ -0,0 +1,23 @@
+import logging
+
+from celery import shared_task
+
+from .models import UserProfile, resize_profile_image
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def resize_profile_image_task(profile_id):
+    """Shrink a profile's uploaded image outside the request cycle"""
+    # Read just the file name; building the model would decrypt its fields
+    name = UserProfile.objects.filter(pk=profile_id).values_list('profile_image', flat=True).first()
+    if not name:
+        return
+    
+    storage = UserProfile._meta.get_field('profile_image').storage
+    try:
+        resize_profile_image(storage.path(name))
+    except Exception as e:
+        # Log the error; the original upload is left in place
+        logger.error(f"Error resizing image for profile {profile_id}: {e}")
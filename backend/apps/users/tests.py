@@ -1,3 +1,78 @@
+from unittest import mock
+
 from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework import status
+from .models import UserProfile
+
+User = get_user_model()
+
+
+class UserProfileSkillsTest(TestCase):
+    """Test cases for keeping skill_set in sync with skills"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+    def test_skills_synced_only_when_changed(self):
+        """Test skill_set is rebuilt on a skills change and skipped otherwise"""
+        profile, _ = UserProfile.objects.get_or_create(user=self.user)
+        profile.skills = 'Python, Django'
+        profile.save()
+        self.assertEqual(
+            sorted(profile.skill_set.values_list('name', flat=True)), ['django', 'python']
+        )
+        
+        profile = UserProfile.objects.get(pk=profile.pk)
+        profile.job_title = 'Developer'
+        with mock.patch.object(UserProfile, 'sync_skills') as sync_skills:
+            profile.save()
+        sync_skills.assert_not_called()
+        
+        profile.skills = 'Python'
+        profile.save()
+        self.assertEqual(list(profile.skill_set.values_list('name', flat=True)), ['python'])
+
+    def test_image_resize_queued_only_when_changed(self):
+        """Test the background resize is only queued for a new image"""
+        profile, _ = UserProfile.objects.get_or_create(user=self.user)
+        with mock.patch('apps.users.signals.resize_profile_image_task') as task:
+            profile.profile_image = 'profiles/profile_1.jpg'
+            with self.captureOnCommitCallbacks(execute=True):
+                profile.save()
+            task.delay.assert_called_once_with(profile.pk)
+            
+            task.reset_mock()
+            profile = UserProfile.objects.get(pk=profile.pk)
+            profile.job_title = 'Developer'
+            with self.captureOnCommitCallbacks(execute=True):
+                profile.save()
+            task.delay.assert_not_called()
+
+
+class UserProfileAPITest(APITestCase):
+    """Test cases for UserProfile API endpoints"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        cls.profile, _ = UserProfile.objects.get_or_create(user=cls.user)
 
-# Create your tests here.
+    def test_upload_unauthenticated(self):
+        """Test anonymous uploads are rejected before the profile lookup"""
+        for name in ('userprofile-upload-profile-image', 'userprofile-upload-resume'):
+            with self.subTest(name):
+                url = reverse(name, kwargs={'pk': self.profile.pk})
+                response = self.client.post(url, {})
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -1,10 +1,37 @@
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from django.urls import path
 from .views import UserProfileViewSet
 
-router = DefaultRouter()
-router.register(r'profiles', UserProfileViewSet)
+# Explicit routes instead of a DefaultRouter: no API root view and no
+# format-suffix variants, so the resolver walks far fewer patterns
+BASENAME = 'userprofile'
+
+
+def action_path(name):
+    """path() for an @action, with the methods and options the router would use"""
+    action = getattr(UserProfileViewSet, name)
+    if action.detail:
+        route = f'profiles/<int:pk>/{action.url_path}/'
+    else:
+        route = f'profiles/{action.url_path}/'
+    view = UserProfileViewSet.as_view(
+        dict(action.mapping), basename=BASENAME, detail=action.detail, **action.kwargs
+    )
+    return path(route, view, name=f'{BASENAME}-{action.url_name}')
+
 
 urlpatterns = [
-    path('', include(router.urls)),
+    path('profiles/', UserProfileViewSet.as_view(
+        {'get': 'list', 'post': 'create'},
+        basename=BASENAME, detail=False, suffix='List'
+    ), name=f'{BASENAME}-list'),
+    # Static action routes go first so they are never read as a pk
+    *(action_path(name) for name in (
+        'my_profile', 'my_stats', 'update_account',
+        'available_candidates', 'profile_stats',
+    )),
+    path('profiles/<int:pk>/', UserProfileViewSet.as_view(
+        {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'},
+        basename=BASENAME, detail=True, suffix='Instance'
+    ), name=f'{BASENAME}-detail'),
+    *(action_path(name) for name in ('upload_profile_image', 'upload_resume')),
 ]
@@ -7,8 +7,12 @@ from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters import rest_framework as filters
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.core.cache import cache
 
-from .models import UserProfile
+from .models import UserProfile, Skill
 from .serializers import (
     UserProfileSerializer, UserProfileUpdateSerializer,
     UserProfilePublicSerializer, UserAccountUpdateSerializer,
@@ -17,6 +21,26 @@ from .serializers import (
 
 User = get_user_model()
 
+# Detail actions only the profile owner may perform
+OWNER_ACTIONS = frozenset({
+    'update', 'partial_update', 'destroy', 'upload_profile_image', 'upload_resume'
+})
+
+PROFILE_STATS_CACHE_KEY = 'users:profile_stats'
+# The public profile statistics change slowly, so serve them from cache
+PROFILE_STATS_CACHE_TIMEOUT = 300
+
+# Columns read by UserProfilePublicSerializer; the other encrypted columns
+# (phone number, address, the user's name parts) are left unloaded
+PUBLIC_PROFILE_FIELDS = (
+    'id', 'bio', 'date_of_birth', 'gender', 'city', 'country',
+    'job_title', 'company', 'experience_level',
+    'expected_salary_min', 'expected_salary_max',
+    'skills', 'education', 'certifications', 'profile_image',
+    'linkedin_url', 'github_url', 'website_url', 'is_available_for_hire',
+    'user__id', 'user__username', 'user__email', 'user__date_joined', 'user__full_name',
+)
+
 
 class UserProfileFilter(filters.FilterSet):
     """Custom filter for user profiles"""
@@ -24,13 +48,20 @@ class UserProfileFilter(filters.FilterSet):
     is_available_for_hire = filters.BooleanFilter()
     city = filters.CharFilter(field_name='city', lookup_expr='icontains')
     country = filters.CharFilter(field_name='country', lookup_expr='icontains')
-    skills = filters.CharFilter(field_name='skills', lookup_expr='icontains')
+    skills = filters.CharFilter(method='filter_skills')
     salary_min = filters.NumberFilter(field_name='expected_salary_min', lookup_expr='gte')
     salary_max = filters.NumberFilter(field_name='expected_salary_max', lookup_expr='lte')
     
     class Meta:
         model = UserProfile
         fields = ['experience_level', 'is_available_for_hire', 'city', 'country', 'skills']
+    
+    def filter_skills(self, queryset, name, value):
+        """Match profiles having any of the comma separated skills"""
+        names = {Skill.normalize(skill) for skill in value.split(',') if skill.strip()}
+        if not names:
+            return queryset
+        return queryset.filter(skill_set__name__in=names).distinct()
 
 
 class UserProfileViewSet(viewsets.ModelViewSet):
@@ -56,23 +87,33 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         """
         Set permissions based on action
-        """
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [permissions.IsAuthenticated]
-        else:
-            permission_classes = [permissions.AllowAny]
         
-        return [permission() for permission in permission_classes]
+        Writes need a signed-in user; everything else uses the view's
+        permission_classes, which @action(permission_classes=...) overrides.
+        """
+        if self.action == 'create' or self.action in OWNER_ACTIONS:
+            return [permissions.IsAuthenticated()]
+        return super().get_permissions()
+    
+    def get_object(self):
+        """
+        Fetch the profile once per request, so is_owner() and the
+        detail actions share a single lookup
+        """
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
     
     def is_owner(self):
         """Check if current user is the profile owner"""
-        if hasattr(self, 'get_object'):
-            try:
-                profile = self.get_object()
-                return self.request.user == profile.user
-            except:
-                return False
-        return False
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg not in self.kwargs:
+            return False
+        try:
+            profile = self.get_object()
+        except Http404:
+            return False
+        return self.request.user == profile.user
     
     def get_queryset(self):
         """Filter queryset based on action and user"""
@@ -84,6 +125,24 @@ class UserProfileViewSet(viewsets.ModelViewSet):
                 return UserProfile.objects.filter(user=self.request.user)
             return UserProfile.objects.none()
         
+        # Writes look the profile up among the user's own, so the ownership
+        # check is part of the single get_object() query
+        if self.action in OWNER_ACTIONS:
+            if self.request.user.is_authenticated:
+                return UserProfile.objects.filter(user=self.request.user).select_related('user')
+            return UserProfile.objects.none()
+        
+        # The list always renders the public serializer
+        if self.action == 'list':
+            queryset = queryset.only(*PUBLIC_PROFILE_FIELDS)
+        
+        # The owner's detail view shows application and job counts
+        if self.action == 'retrieve':
+            queryset = queryset.annotate(
+                annotated_application_count=Count('user__applications', distinct=True),
+                annotated_jobs_posted_count=Count('user__posted_jobs', distinct=True),
+            )
+        
         return queryset
     
     def create(self, request, *args, **kwargs):
@@ -98,30 +157,6 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    def update(self, request, *args, **kwargs):
-        """Update user profile (only owner can update)"""
-        profile = self.get_object()
-        
-        if profile.user != request.user:
-            return Response(
-                {'error': 'You can only update your own profile'}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        return super().update(request, *args, **kwargs)
-    
-    def destroy(self, request, *args, **kwargs):
-        """Delete user profile (only owner can delete)"""
-        profile = self.get_object()
-        
-        if profile.user != request.user:
-            return Response(
-                {'error': 'You can only delete your own profile'}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        return super().destroy(request, *args, **kwargs)
-    
     @action(detail=False, methods=['get', 'put', 'patch'], permission_classes=[permissions.IsAuthenticated])
     def my_profile(self, request):
         """
@@ -173,14 +208,9 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         """
         Upload profile image separately
         """
+        # Owner-scoped queryset: other users' profiles 404
         profile = self.get_object()
         
-        if profile.user != request.user:
-            return Response(
-                {'error': 'You can only update your own profile'}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         if 'profile_image' not in request.FILES:
             return Response(
                 {'error': 'No image file provided'}, 
@@ -206,14 +236,9 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         """
         Upload resume separately
         """
+        # Owner-scoped queryset: other users' profiles 404
         profile = self.get_object()
         
-        if profile.user != request.user:
-            return Response(
-                {'error': 'You can only update your own profile'}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         if 'resume' not in request.FILES:
             return Response(
                 {'error': 'No resume file provided'}, 
@@ -238,7 +263,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         profiles = UserProfile.objects.filter(
             is_profile_public=True, 
             is_available_for_hire=True
-        ).select_related('user')
+        ).select_related('user').only(*PUBLIC_PROFILE_FIELDS)
         
         # Apply filters
         filtered_profiles = self.filter_queryset(profiles)
@@ -257,29 +282,31 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         """
         Get general profile statistics
         """
-        from django.db.models import Count, Avg
-        
-        total_profiles = UserProfile.objects.filter(is_profile_public=True).count()
-        available_candidates = UserProfile.objects.filter(
-            is_profile_public=True, 
-            is_available_for_hire=True
-        ).count()
-        
-        # Experience level distribution
-        experience_stats = UserProfile.objects.filter(
-            is_profile_public=True,
-            experience_level__isnull=False
-        ).values('experience_level').annotate(count=Count('id'))
+        return Response(cache.get_or_set(
+            PROFILE_STATS_CACHE_KEY, self._compute_profile_stats, PROFILE_STATS_CACHE_TIMEOUT
+        ))
+    
+    @staticmethod
+    def _compute_profile_stats():
+        """Counts and averages in one aggregate, plus the experience distribution"""
+        public_profiles = UserProfile.objects.filter(is_profile_public=True)
         
-        # Average expected salary
-        avg_salary = UserProfile.objects.filter(
-            is_profile_public=True,
-            expected_salary_min__isnull=False
-        ).aggregate(avg_salary=Avg('expected_salary_min'))
+        with transaction.atomic():
+            totals = public_profiles.aggregate(
+                total=Count('id'),
+                available=Count('id', filter=Q(is_available_for_hire=True)),
+                avg_salary=Avg('expected_salary_min'),
+            )
+            
+            # Experience level distribution
+            experience_stats = list(
+                public_profiles.filter(experience_level__isnull=False)
+                .values('experience_level').annotate(count=Count('id'))
+            )
         
-        return Response({
-            'total_public_profiles': total_profiles,
-            'available_candidates': available_candidates,
-            'experience_level_distribution': list(experience_stats),
-            'average_expected_salary': avg_salary['avg_salary']
-        })
+        return {
+            'total_public_profiles': totals['total'],
+            'available_candidates': totals['available'],
+            'experience_level_distribution': experience_stats,
+            'average_expected_salary': totals['avg_salary']
+        }
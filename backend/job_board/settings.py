@@ -76,6 +76,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sessions',
+    'django.contrib.postgres',
     'apps.users',
     'apps.jobs',
     'apps.categories',
@@ -153,6 +154,32 @@ DATABASES = {
 }
 
 
+# Cache
+# Uses Redis when REDIS_URL is configured, otherwise a per-process memory cache
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Celery
+# Without a broker, tasks run inline in the calling process
+CELERY_TASK_ALWAYS_EAGER = not config('CELERY_BROKER_URL', default='')
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='memory://')
+CELERY_TASK_IGNORE_RESULT = True
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
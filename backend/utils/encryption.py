@@ -1,16 +1,26 @@
-from cryptography.fernet import Fernet, InvalidToken
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, MultiFernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from django.db import models
+from django.core import checks
+from django.core.signals import setting_changed
+from django.db import connection, models, transaction
+from django.dispatch import receiver
 from django.core.exceptions import ValidationError
 from django.conf import settings
+from concurrent.futures import ThreadPoolExecutor
 import base64
+import functools
 import hashlib
-import json
+from itertools import islice
 import logging
+import orjson
 import os
+import re
+import time
 from typing import Union, Optional, Any, List, Dict
-from datetime import datetime
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -24,53 +34,190 @@ class DecryptionError(Exception):
     """Custom exception for decryption-related errors"""
     pass
 
+# ===== HARDWARE CHECK =====
+CPUINFO_PATH = '/proc/cpuinfo'
+# AES and carry-less multiply support as listed in /proc/cpuinfo:
+# x86 reports them on the "flags" line, ARM on the "Features" line
+HARDWARE_AES_FLAGS = {
+    'flags': ('aes', 'pclmulqdq'),
+    'Features': ('aes', 'pmull'),
+}
+
+def check_hardware_aes(app_configs=None, **kwargs) -> List[checks.CheckMessage]:
+    """System check warning when the CPU lacks AES and CLMUL/PMULL for AES-GCM
+    
+    OpenSSL picks these up automatically; without them AES-GCM falls back
+    to a much slower software path, which is worth flagging to ops.
+    CPUs that report neither line are not checked.
+    """
+    try:
+        with open(CPUINFO_PATH) as cpuinfo:
+            for line in cpuinfo:
+                label, _, value = line.partition(':')
+                required = HARDWARE_AES_FLAGS.get(label.strip())
+                if required is not None:
+                    break
+            else:
+                return []
+    except OSError:
+        return []
+    
+    flags = value.split()
+    missing = [flag for flag in required if flag not in flags]
+    if not missing:
+        return []
+    return [checks.Warning(
+        f"CPU lacks {', '.join(missing)}; AES-GCM will run in software",
+        hint="Encrypting and decrypting fields will be noticeably slower on this host.",
+        id='encryption.W001',
+    )]
+
 # ===== CORE ENCRYPTION FUNCTIONS =====
-def _generate_key(key: str, salt: Optional[bytes] = None) -> bytes:
-    """Generate a Fernet key based on the provided key using PBKDF2"""
+def _key_bytes(key: Union[str, bytes]) -> bytes:
+    """Return the key as UTF-8 bytes, encoding it only if needed"""
+    return key.encode('utf-8') if isinstance(key, str) else key
+
+def _generate_key(key: Union[str, bytes], salt: Optional[bytes] = None) -> bytes:
+    """Generate a Fernet key based on the provided key using HKDF
+    
+    ENCRYPTION_KEY is a high-entropy secret, not a user password, so a
+    single HKDF pass is enough; stretching it adds no security.
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        info=b'fernet-v1',
+    )
+    
+    key_bytes = hkdf.derive(_key_bytes(key))
+    return base64.urlsafe_b64encode(key_bytes)
+
+def _generate_legacy_key(key: Union[str, bytes], salt: Optional[bytes] = None) -> bytes:
+    """Generate the PBKDF2 Fernet key used before the switch to HKDF
+    
+    Only needed to decrypt values written with the old derivation.
+    """
+    key = _key_bytes(key)
     if salt is None:
         # Use a consistent salt for the same key to ensure consistent encryption
-        salt = hashlib.sha256(key.encode()).digest()[:16]
+        salt = hashlib.sha256(key).digest()[:16]
     
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
-        iterations=100000,  # Recommended minimum iterations
+        iterations=100000,
     )
     
-    key_bytes = kdf.derive(key.encode())
+    key_bytes = kdf.derive(key)
     return base64.urlsafe_b64encode(key_bytes)
 
+# AES-GCM values are stored as ENCRYPTED_PREFIX + base64(nonce + ciphertext + tag)
+ENCRYPTED_PREFIX = 'ENC1:'
+GCM_NONCE_SIZE = 12
+GCM_TAG_SIZE = 16
+# Legacy Fernet tokens start with b'gAAAAA', which base64 encodes to this
+LEGACY_FERNET_RE = re.compile(r'Z0FBQUFB[A-Za-z0-9+/]{92,}={0,2}')
+
+def _generate_aead_key(key: Union[str, bytes]) -> bytes:
+    """Generate a 256-bit AES-GCM key based on the provided key using HKDF"""
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b'aesgcm-v1',
+    )
+    return hkdf.derive(_key_bytes(key))
+
+@functools.lru_cache(maxsize=8)
+def _get_aead(key: str) -> AESGCM:
+    """Build the AES-GCM instance for a key once per process"""
+    return AESGCM(_generate_aead_key(_key_bytes(key)))
+
+@functools.lru_cache(maxsize=8)
+def _get_fernet(key: str) -> MultiFernet:
+    """Build the Fernet instance for a key once per process
+    
+    Only used to decrypt values written before the switch to AES-GCM.
+    The HKDF key is tried first, then the legacy PBKDF2 key.
+    """
+    key_bytes = _key_bytes(key)
+    return MultiFernet([
+        Fernet(_generate_key(key_bytes)),
+        Fernet(_generate_legacy_key(key_bytes)),
+    ])
+
+@functools.lru_cache(maxsize=None)
 def _get_encryption_key() -> str:
-    """Get encryption key from settings with fallback"""
+    """Get encryption key from settings with fallback
+    
+    The key is read once per process; the cache is cleared whenever
+    settings.ENCRYPTION_KEY is changed through override_settings.
+    """
     try:
         return getattr(settings, 'ENCRYPTION_KEY', 'default-key-change-this-in-production')
     except:
         # Fallback if Django is not available
         return os.getenv('ENCRYPTION_KEY', 'default-key-change-this-in-production')
 
+@receiver(setting_changed)
+def _clear_encryption_key(setting, **kwargs):
+    """Drop the cached key when a test overrides ENCRYPTION_KEY"""
+    if setting == 'ENCRYPTION_KEY':
+        _get_encryption_key.cache_clear()
+
+def encrypted_length(length: int) -> int:
+    """Return the longest value encrypt_data can produce for `length` characters
+    
+    Assumes the worst case of 4 UTF-8 bytes per character.
+    """
+    payload_size = GCM_NONCE_SIZE + GCM_TAG_SIZE + 4 * length
+    return len(ENCRYPTED_PREFIX) + 4 * -(-payload_size // 3)
+
 def _is_encrypted_data(data: str) -> bool:
-    """Check if data appears to be encrypted based on format"""
-    if not data or len(data) < 50:
-        return False
+    """Check if data appears to be encrypted based on its prefix"""
+    return isinstance(data, str) and (
+        data.startswith(ENCRYPTED_PREFIX)
+        or LEGACY_FERNET_RE.fullmatch(data) is not None
+    )
+
+def _encrypt_bytes(plaintext: bytes, key: str, nonce: Optional[bytes] = None) -> str:
+    """Encrypt bytes with AES-GCM and return the prefixed base64 payload"""
+    if nonce is None:
+        nonce = os.urandom(GCM_NONCE_SIZE)
+    ciphertext = _get_aead(key).encrypt(nonce, plaintext, None)
+    return ENCRYPTED_PREFIX + base64.b64encode(nonce + ciphertext).decode('ascii')
+
+def _decrypt_bytes(encrypted_data: str, key: str) -> bytes:
+    """Decrypt a prefixed AES-GCM payload, or a legacy Fernet token"""
+    if encrypted_data.startswith(ENCRYPTED_PREFIX):
+        # Slice through a memoryview so the ciphertext isn't copied again
+        raw = memoryview(base64.b64decode(encrypted_data[len(ENCRYPTED_PREFIX):].encode('ascii')))
+        return _get_aead(key).decrypt(raw[:GCM_NONCE_SIZE], raw[GCM_NONCE_SIZE:], None)
+    return _get_fernet(key).decrypt(base64.b64decode(encrypted_data.encode('ascii')))
+
+# Process-wide plaintext cache for values decrypted more than once
+DECRYPT_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=DECRYPT_CACHE_SIZE)
+def _decrypt_cached(encrypted_data: str, key: str) -> str:
+    """Decrypt a value to text, reusing the result for ciphertext seen before
     
-    try:
-        # Check if it's valid base64 and has characteristics of encrypted data
-        base64.b64decode(data.encode('ascii'))
-        # Encrypted data typically contains equals signs and is long
-        return '=' in data and len(data) > 50
-    except:
-        return False
+    Each ciphertext has a random nonce, so a cache hit is always the same
+    stored value. Failures raise and are not cached.
+    """
+    return _decrypt_bytes(encrypted_data, key).decode('utf-8')
 
 def encrypt_data(data: Union[str, dict, list, int, float, bool], key: Optional[str] = None) -> str:
-    """Encrypt given data using Fernet encryption
+    """Encrypt given data using AES-GCM encryption
     
     Args:
         data: Data to encrypt
         key: Encryption key (optional, will use default from settings)
         
     Returns:
-        str: Base64 encoded encrypted data
+        str: ENCRYPTED_PREFIX followed by base64 encoded encrypted data
         
     Raises:
         EncryptionError: If encryption fails
@@ -79,46 +226,44 @@ def encrypt_data(data: Union[str, dict, list, int, float, bool], key: Optional[s
         key = _get_encryption_key()
     
     try:
-        # Handle None values
-        if data is None:
-            return ''
-        
-        # Convert data to string format
-        if isinstance(data, str):
-            data_str = data
-        elif isinstance(data, (dict, list)):
-            data_str = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-        else:
-            data_str = str(data)
-        
-        # Skip encryption for empty strings
-        if not data_str.strip():
-            return ''
-        
-        # Check if already encrypted to prevent double encryption
-        if _is_encrypted_data(data_str):
-            logger.info("Data appears to already be encrypted, skipping encryption")
-            return data_str
-        
-        # Generate encryption key
-        fernet_key = _generate_key(key)
-        fernet = Fernet(fernet_key)
-        
-        # Simple encryption without metadata to avoid complexity
-        encrypted_bytes = fernet.encrypt(data_str.encode('utf-8'))
-        
-        # Return base64 encoded string
-        return base64.b64encode(encrypted_bytes).decode('ascii')
+        plaintext = _prepare_plaintext(data)
+        if isinstance(plaintext, str):
+            return plaintext
+        return _encrypt_bytes(plaintext, key)
         
     except Exception as e:
         logger.error(f"Encryption failed: {str(e)}")
         raise EncryptionError(f"Failed to encrypt data: {str(e)}")
 
+def _prepare_plaintext(data: Any) -> Union[bytes, str]:
+    """Return the bytes to encrypt, or a str to return unencrypted as-is"""
+    # Handle None values
+    if data is None:
+        return ''
+    
+    # JSON is never blank or prefixed, so encrypt orjson's UTF-8 output directly
+    if isinstance(data, (dict, list)):
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    
+    # Convert data to string format
+    data_str = data if isinstance(data, str) else str(data)
+    
+    # Skip encryption for empty strings
+    if not data_str.strip():
+        return ''
+    
+    # Check if already encrypted to prevent double encryption
+    if _is_encrypted_data(data_str):
+        logger.info("Data appears to already be encrypted, skipping encryption")
+        return data_str
+    
+    return data_str.encode('utf-8')
+
 def decrypt_data(encrypted_data: str, key: Optional[str] = None) -> str:
-    """Decrypt given data using Fernet decryption
+    """Decrypt given data encrypted by encrypt_data
     
     Args:
-        encrypted_data: Base64 encoded encrypted data
+        encrypted_data: Value returned by encrypt_data
         key: Decryption key (optional, will use default from settings)
         
     Returns:
@@ -140,93 +285,208 @@ def decrypt_data(encrypted_data: str, key: Optional[str] = None) -> str:
             logger.info("Data appears to be unencrypted, returning as-is")
             return encrypted_data
         
-        # Decode from base64
-        encrypted_bytes = base64.b64decode(encrypted_data.encode('ascii'))
-        
-        # Generate decryption key
-        fernet_key = _generate_key(key)
-        fernet = Fernet(fernet_key)
-        
-        # Decrypt the data
-        decrypted_bytes = fernet.decrypt(encrypted_bytes)
-        decrypted_str = decrypted_bytes.decode('utf-8')
-        
-        return decrypted_str
+        return _decrypt_cached(encrypted_data, key)
             
-    except (InvalidToken, base64.binascii.Error, ValueError) as e:
+    except (InvalidToken, InvalidTag, base64.binascii.Error, ValueError) as e:
         logger.error(f"Decryption failed: {str(e)}")
         raise DecryptionError(f"Failed to decrypt data: {str(e)}")
     except Exception as e:
         logger.error(f"Unexpected decryption error: {str(e)}")
         raise DecryptionError(f"Failed to decrypt data: {str(e)}")
 
+def try_decrypt(encrypted_data: str, key: Optional[str] = None) -> Optional[str]:
+    """Decrypt given data, returning None instead of raising on failure
+    
+    The failure is still logged by decrypt_data, so callers can simply
+    check the result instead of wrapping every call in try/except.
+    """
+    try:
+        return decrypt_data(encrypted_data, key)
+    except DecryptionError:
+        return None
+
+def encrypt_many(values: List[Any], key: Optional[str] = None) -> List[str]:
+    """Encrypt several values with one key lookup and one nonce draw
+    
+    Args:
+        values: Values accepted by encrypt_data
+        key: Encryption key (optional, will use default from settings)
+        
+    Returns:
+        List[str]: Encrypted values in the same order
+        
+    Raises:
+        EncryptionError: If any value fails to encrypt
+    """
+    if key is None:
+        key = _get_encryption_key()
+    
+    try:
+        # Draw every nonce with a single urandom call
+        nonces = os.urandom(GCM_NONCE_SIZE * len(values))
+        results = []
+        for index, value in enumerate(values):
+            plaintext = _prepare_plaintext(value)
+            if isinstance(plaintext, str):
+                results.append(plaintext)
+                continue
+            
+            nonce = nonces[index * GCM_NONCE_SIZE:(index + 1) * GCM_NONCE_SIZE]
+            results.append(_encrypt_bytes(plaintext, key, nonce))
+    except Exception as e:
+        logger.error(f"Batch encryption failed: {str(e)}")
+        raise EncryptionError(f"Failed to encrypt data: {str(e)}")
+    
+    return results
+
+def decrypt_many(encrypted_values: List[str], key: Optional[str] = None) -> List[str]:
+    """Decrypt several values with a single key lookup
+    
+    Args:
+        encrypted_values: Values returned by encrypt_data
+        key: Decryption key (optional, will use default from settings)
+        
+    Returns:
+        List[str]: Decrypted values in the same order; values that do not
+        look encrypted are returned as-is, like decrypt_data
+        
+    Raises:
+        DecryptionError: If any value fails to decrypt
+    """
+    if key is None:
+        key = _get_encryption_key()
+    
+    results = []
+    try:
+        for encrypted_data in encrypted_values:
+            if not encrypted_data or not encrypted_data.strip():
+                results.append('')
+                continue
+            if not _is_encrypted_data(encrypted_data):
+                results.append(encrypted_data)
+                continue
+            
+            results.append(_decrypt_cached(encrypted_data, key))
+    except (InvalidToken, InvalidTag, base64.binascii.Error, ValueError) as e:
+        logger.error(f"Batch decryption failed: {str(e)}")
+        raise DecryptionError(f"Failed to decrypt data: {str(e)}")
+    
+    return results
+
 # ===== DJANGO MODEL MIXIN =====
 class EncryptedFieldMixin:
     """Mixin to handle encrypted fields in Django models"""
     
     # Override in subclass to specify which fields should be encrypted
     ENCRYPTED_FIELDS: List[str] = []
+    # Built from ENCRYPTED_FIELDS for O(1) membership tests
+    _ENCRYPTED_FIELDS_SET: frozenset = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ENCRYPTED_FIELDS_SET = frozenset(cls.ENCRYPTED_FIELDS)
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._original_values = {}
-        self._decrypted_cache = {}
         # Store original values after loading from DB
         self._store_original_values()
     
     def save(self, *args, **kwargs):
         """Override save to encrypt sensitive fields before saving"""
+        update_fields = kwargs.get('update_fields')
+        
         # Encrypt fields before saving
-        self._encrypt_fields()
+        self._encrypt_fields(update_fields)
         
         # Call parent save
         super().save(*args, **kwargs)
         
-        # Update original values after save
-        self._store_original_values()
+        # Update original values after save, only for the fields written
+        if update_fields is None:
+            self._store_original_values()
+        else:
+            values = self.__dict__
+            self._original_values.update(
+                (field_name, values[field_name])
+                for field_name in self._ENCRYPTED_FIELDS_SET.intersection(update_fields)
+                if field_name in values
+            )
     
     def refresh_from_db(self, using=None, fields=None):
         """Override refresh to clear decrypted cache"""
         super().refresh_from_db(using=using, fields=fields)
-        self._decrypted_cache.clear()
+        self.__dict__.pop('_decrypted_cache', None)
         self._store_original_values()
     
     def _store_original_values(self):
-        """Store original values for change detection"""
-        for field_name in self.ENCRYPTED_FIELDS:
-            if hasattr(self, field_name):
-                self._original_values[field_name] = getattr(self, field_name)
-    
-    def _encrypt_fields(self):
-        """Encrypt all fields marked for encryption"""
-        for field_name in self.ENCRYPTED_FIELDS:
-            if hasattr(self, field_name):
-                current_value = getattr(self, field_name)
-                
-                # Only encrypt if value exists and has changed
-                if (current_value and 
-                    current_value != self._original_values.get(field_name)):
-                    
-                    # Skip if already encrypted
-                    if _is_encrypted_data(current_value):
-                        continue
-                    
-                    try:
-                        encrypted_value = encrypt_data(current_value)
-                        setattr(self, field_name, encrypted_value)
-                        logger.debug(f"Encrypted field '{field_name}' for {self.__class__.__name__}")
-                    except EncryptionError as e:
-                        logger.error(f"Failed to encrypt field '{field_name}': {str(e)}")
-                        raise ValidationError(f"Failed to encrypt {field_name}: {str(e)}")
+        """Store original values for change detection
+        
+        Values are read from __dict__ directly: encrypted fields are
+        concrete columns, and deferred ones are skipped without a query.
+        """
+        values = self.__dict__
+        self._original_values = {
+            field_name: values[field_name]
+            for field_name in self.ENCRYPTED_FIELDS
+            if field_name in values
+        }
+    
+    def _encrypt_fields(self, update_fields=None):
+        """Encrypt all fields marked for encryption
+        
+        When save() is limited to update_fields, only encrypted fields
+        among them are considered.
+        """
+        field_names = self.ENCRYPTED_FIELDS
+        if update_fields is not None:
+            field_names = self._ENCRYPTED_FIELDS_SET.intersection(update_fields)
+            if not field_names:
+                return
+        
+        values = self.__dict__
+        changed = [
+            (field_name, current_value)
+            for field_name, current_value in (
+                (field_name, values.get(field_name))
+                for field_name in field_names
+            )
+            # Only encrypt if value exists, has changed and isn't already encrypted
+            if current_value
+            and current_value != self._original_values.get(field_name)
+            and not _is_encrypted_data(current_value)
+        ]
+        if not changed:
+            return
+        
+        # Resolve the key once for the whole row
+        key = _get_encryption_key()
+        for field_name, current_value in changed:
+            try:
+                values[field_name] = encrypt_data(current_value, key)
+                logger.debug(f"Encrypted field '{field_name}' for {self.__class__.__name__}")
+            except EncryptionError as e:
+                logger.error(f"Failed to encrypt field '{field_name}': {str(e)}")
+                raise ValidationError(f"Failed to encrypt {field_name}: {str(e)}")
+    
+    def _get_decrypted_cache(self) -> Dict[str, str]:
+        """Return the per-instance decrypted value cache, creating it on first use
+        
+        Rows whose encrypted fields are never read don't allocate it.
+        """
+        decrypted_cache = self.__dict__.get('_decrypted_cache')
+        if decrypted_cache is None:
+            decrypted_cache = self.__dict__['_decrypted_cache'] = {}
+        return decrypted_cache
     
     def get_decrypted_field(self, field_name: str) -> str:
         """Get decrypted value of an encrypted field"""
-        if field_name not in self.ENCRYPTED_FIELDS:
+        if field_name not in self._ENCRYPTED_FIELDS_SET:
             return getattr(self, field_name, '')
         
         # Check cache first
-        if field_name in self._decrypted_cache:
-            return self._decrypted_cache[field_name]
+        decrypted_cache = self._get_decrypted_cache()
+        if field_name in decrypted_cache:
+            return decrypted_cache[field_name]
         
         encrypted_value = getattr(self, field_name, '')
         if not encrypted_value:
@@ -235,7 +495,7 @@ class EncryptedFieldMixin:
         try:
             decrypted_value = decrypt_data(encrypted_value)
             # Cache the decrypted value
-            self._decrypted_cache[field_name] = decrypted_value
+            decrypted_cache[field_name] = decrypted_value
             return decrypted_value
         except DecryptionError as e:
             logger.error(f"Failed to decrypt field '{field_name}': {str(e)}")
@@ -246,28 +506,55 @@ class EncryptedFieldMixin:
         """Set field value (will be encrypted on save if field is marked for encryption)"""
         setattr(self, field_name, value)
         # Clear from cache since we're setting a new value
-        self._decrypted_cache.pop(field_name, None)
+        self.__dict__.get('_decrypted_cache', {}).pop(field_name, None)
     
     def get_all_decrypted_fields(self) -> Dict[str, str]:
-        """Get all decrypted field values as a dictionary"""
-        result = {}
-        for field_name in self.ENCRYPTED_FIELDS:
-            result[field_name] = self.get_decrypted_field(field_name)
-        return result
+        """Get all decrypted field values as a dictionary
+        
+        Uncached fields are decrypted together in one decrypt_many call;
+        if any of them fails, each falls back to get_decrypted_field.
+        """
+        decrypted_cache = self._get_decrypted_cache()
+        pending = [
+            field_name for field_name in self.ENCRYPTED_FIELDS
+            if field_name not in decrypted_cache and getattr(self, field_name, '')
+        ]
+        if pending:
+            try:
+                decrypted = decrypt_many([getattr(self, field_name) for field_name in pending])
+                decrypted_cache.update(zip(pending, decrypted))
+            except DecryptionError:
+                pass
+        
+        return {
+            field_name: self.get_decrypted_field(field_name)
+            for field_name in self.ENCRYPTED_FIELDS
+        }
 
 # ===== DJANGO CUSTOM FIELD =====
 class EncryptedCharField(models.CharField):
     """Custom CharField that automatically handles encryption/decryption"""
     
     def __init__(self, *args, **kwargs):
-        # Encrypted data is typically longer, so adjust max_length
-        if 'max_length' in kwargs and kwargs['max_length'] < 500:
-            kwargs['max_length'] = 500
+        # max_length is given in plaintext characters; size the column for the ciphertext
+        self.plaintext_max_length = kwargs.get('max_length')
+        if self.plaintext_max_length is not None:
+            kwargs['max_length'] = encrypted_length(self.plaintext_max_length)
         super().__init__(*args, **kwargs)
     
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.plaintext_max_length is not None:
+            kwargs['max_length'] = self.plaintext_max_length
+        return name, path, args, kwargs
+    
     def from_db_value(self, value, expression, connection):
-        """Decrypt value when loading from database"""
-        if value is None:
+        """Decrypt value when loading from database
+        
+        Values without an encrypted prefix (rows not yet migrated) are
+        returned as-is and get encrypted on their next save.
+        """
+        if not _is_encrypted_data(value):
             return value
         try:
             return decrypt_data(value)
@@ -294,12 +581,19 @@ class EncryptedCharField(models.CharField):
             return value
 
 # ===== UTILITY FUNCTIONS =====
-def encrypt_dict(data_dict: dict, fields_to_encrypt: list, key: Optional[str] = None) -> dict:
-    """Encrypt specific fields in a dictionary"""
+def encrypt_dict(data_dict: dict, fields_to_encrypt: list, key: Optional[str] = None,
+                 inplace: bool = False) -> dict:
+    """Encrypt specific fields in a dictionary
+    
+    With inplace=True the given dictionary is updated and returned
+    instead of a copy.
+    """
     if not isinstance(data_dict, dict):
         raise ValueError("data_dict must be a dictionary")
     
-    result = data_dict.copy()
+    if key is None:
+        key = _get_encryption_key()
+    result = data_dict if inplace else data_dict.copy()
     
     for field in fields_to_encrypt:
         if field in result and result[field] is not None:
@@ -310,12 +604,19 @@ def encrypt_dict(data_dict: dict, fields_to_encrypt: list, key: Optional[str] =
     
     return result
 
-def decrypt_dict(data_dict: dict, fields_to_decrypt: list, key: Optional[str] = None) -> dict:
-    """Decrypt specific fields in a dictionary"""
+def decrypt_dict(data_dict: dict, fields_to_decrypt: list, key: Optional[str] = None,
+                 inplace: bool = False) -> dict:
+    """Decrypt specific fields in a dictionary
+    
+    With inplace=True the given dictionary is updated and returned
+    instead of a copy.
+    """
     if not isinstance(data_dict, dict):
         raise ValueError("data_dict must be a dictionary")
     
-    result = data_dict.copy()
+    if key is None:
+        key = _get_encryption_key()
+    result = data_dict if inplace else data_dict.copy()
     
     for field in fields_to_decrypt:
         if field in result and result[field] is not None:
@@ -345,12 +646,23 @@ def test_encryption_roundtrip(test_data: str = "Test Data 123") -> bool:
         logger.error(f"Encryption test failed: {str(e)}")
         return False
 
-def validate_encryption_setup() -> Dict[str, Any]:
-    """Validate encryption configuration"""
+# Set once a roundtrip test passes; failures are always retried
+_roundtrip_passed = False
+
+def validate_encryption_setup(force: bool = False) -> Dict[str, Any]:
+    """Validate encryption configuration
+    
+    The roundtrip test only runs until it first passes, so health checks
+    can call this cheaply; pass force=True to always re-run it.
+    """
+    global _roundtrip_passed
+    if force or not _roundtrip_passed:
+        _roundtrip_passed = test_encryption_roundtrip()
+    
     result = {
         'encryption_enabled': is_encryption_enabled(),
         'key_configured': bool(_get_encryption_key()),
-        'roundtrip_test': test_encryption_roundtrip(),
+        'roundtrip_test': _roundtrip_passed,
         'recommendations': []
     }
     
@@ -367,6 +679,10 @@ def validate_encryption_setup() -> Dict[str, Any]:
     return result
 
 # ===== DATA MIGRATION FUNCTIONS =====
+BULK_UPDATE_BATCH_SIZE = 1000
+FIX_WORKERS = os.cpu_count() or 1
+SLOW_BATCH_SECONDS = 1.0
+
 def fix_multiple_encrypted_data(model_class, field_names: List[str], batch_size: int = 100) -> Dict[str, int]:
     """Fix data that has been encrypted multiple times
     
@@ -380,65 +696,107 @@ def fix_multiple_encrypted_data(model_class, field_names: List[str], batch_size:
     """
     stats = {'processed': 0, 'fixed': 0, 'failed': 0, 'skipped': 0}
     
-    queryset = model_class.objects.all()
+    # Only the fields being fixed are read or written
+    queryset = model_class.objects.only('pk', *field_names)
     total = queryset.count()
     
     logger.info(f"Starting to fix multiple encryption for {total} records")
     
-    for offset in range(0, total, batch_size):
-        batch = queryset[offset:offset + batch_size]
+    # One server-side cursor scan instead of a LIMIT/OFFSET query per batch
+    records = queryset.iterator(chunk_size=batch_size)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        fixed = []
+        changed_fields = set()
+        
+        for instance, instance_fields in _fix_instances(batch, field_names, stats):
+            fixed.append(instance)
+            changed_fields.update(instance_fields)
         
-        for instance in batch:
+        if fixed:
+            _bulk_update_fixed(model_class, fixed, changed_fields, stats)
+    
+    return stats
+
+def _fix_instances(instances, field_names: List[str], stats: Dict[str, int]):
+    """Yield (instance, changed_fields) for instances whose fields were unwrapped
+    
+    Rows are decrypted on a thread pool; OpenSSL releases the GIL during
+    cipher operations. Stats are only updated from the calling thread.
+    """
+    with ThreadPoolExecutor(max_workers=FIX_WORKERS) as executor:
+        results = executor.map(lambda instance: _fix_instance(instance, field_names), instances)
+        for instance, changed_fields, error in results:
             stats['processed'] += 1
-            
-            try:
-                needs_save = False
-                for field_name in field_names:
-                    if hasattr(instance, field_name):
-                        encrypted_value = getattr(instance, field_name)
-                        if encrypted_value:
-                            # Try to decrypt multiple times until we get readable data
-                            decrypted_value = _decrypt_multiple_layers(encrypted_value)
-                            if decrypted_value != encrypted_value:
-                                # We successfully decrypted, now save the clean data
-                                setattr(instance, field_name, decrypted_value)
-                                needs_save = True
-                
-                if needs_save:
-                    # Temporarily disable encryption during save to store clean data
-                    original_encrypted_fields = getattr(instance, 'ENCRYPTED_FIELDS', [])
-                    instance.ENCRYPTED_FIELDS = []
-                    instance.save()
-                    instance.ENCRYPTED_FIELDS = original_encrypted_fields
-                    stats['fixed'] += 1
-                else:
-                    stats['skipped'] += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to fix {instance}: {str(e)}")
+            if error is not None:
+                logger.error(f"Failed to fix {instance}: {error}")
                 stats['failed'] += 1
+            elif changed_fields:
+                yield instance, changed_fields
+            else:
+                stats['skipped'] += 1
+
+def _fix_instance(instance, field_names: List[str]):
+    """Unwrap one instance's fields, returning (instance, changed_fields, error)"""
+    try:
+        changed_fields = []
+        for field_name in field_names:
+            encrypted_value = getattr(instance, field_name, None)
+            if encrypted_value:
+                # Try to decrypt multiple times until we get readable data
+                decrypted_value = _decrypt_multiple_layers(encrypted_value)
+                if decrypted_value != encrypted_value:
+                    setattr(instance, field_name, decrypted_value)
+                    changed_fields.append(field_name)
+        return instance, changed_fields, None
+    except Exception as e:
+        return instance, [], str(e)
+
+def _bulk_update_fixed(model_class, instances: list, field_names, stats: Dict[str, int]) -> None:
+    """Write a batch of fixed instances with a single bulk UPDATE
     
-    return stats
+    bulk_update bypasses save(), so the clean values are stored without
+    EncryptedFieldMixin encrypting them again.
+    """
+    try:
+        with transaction.atomic(), connection.execute_wrapper(_log_slow_batch):
+            model_class.objects.bulk_update(instances, sorted(field_names), batch_size=BULK_UPDATE_BATCH_SIZE)
+        stats['fixed'] += len(instances)
+    except Exception as e:
+        logger.error(f"Failed to save batch of {len(instances)} {model_class.__name__} records: {str(e)}")
+        stats['failed'] += len(instances)
+
+def _log_slow_batch(execute, sql, params, many, context):
+    """Database execute wrapper that logs slow bulk update statements"""
+    started = time.monotonic()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.monotonic() - started
+        if duration > SLOW_BATCH_SECONDS:
+            logger.warning(f"Slow bulk update batch took {duration:.2f}s")
 
 def _decrypt_multiple_layers(encrypted_data: str, max_attempts: int = 5) -> str:
-    """Attempt to decrypt data that may have been encrypted multiple times"""
+    """Attempt to decrypt data that may have been encrypted multiple times
+    
+    Each layer is sniffed once by prefix and then decrypted directly, so
+    failed layers are not logged as decryption errors.
+    """
+    key = _get_encryption_key()
     current_data = encrypted_data
     
     for attempt in range(max_attempts):
-        try:
-            # Try to decrypt
-            decrypted = decrypt_data(current_data)
-            
-            # If the result still looks encrypted, try again
-            if _is_encrypted_data(decrypted):
-                current_data = decrypted
-                continue
-            else:
+        if not _is_encrypted_data(current_data):
+            if attempt:
                 # We got readable data
-                logger.info(f"Successfully decrypted after {attempt + 1} attempts")
-                return decrypted
-                
-        except DecryptionError:
+                logger.info(f"Successfully decrypted after {attempt} attempts")
+            return current_data
+        
+        try:
+            current_data = _decrypt_bytes(current_data, key).decode('utf-8')
+        except (InvalidToken, InvalidTag, base64.binascii.Error, ValueError):
             # Can't decrypt further, return what we have
             break
     
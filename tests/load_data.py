@@ -2,10 +2,16 @@
 """
 Load fake data for testing the job board application
 """
+import functools
+import hashlib
+import logging
+import logging.handlers
+import multiprocessing
 import os
+import pickle
 import sys
 import django
-from faker import Faker
+from faker import Faker, VERSION as FAKER_VERSION
 from datetime import datetime, timedelta
 import random
 
@@ -19,16 +25,160 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'job_board.settings')
 django.setup()
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils.text import slugify
 from apps.categories.models import Category
 from apps.jobs.models import Job
+from apps.jobs.signals import bump_featured_jobs_version
 from apps.applications.models import Application
-from apps.users.models import UserProfile
+from apps.users.models import ProfileSkill, Skill, UserProfile
 
-fake = Faker()
 User = get_user_model()
+logger = logging.getLogger('dataloader')
+
+# Rows per INSERT statement for every bulk_create; on PostgreSQL gains level
+# off somewhere between 100 and 1000 rows
+BULK_CREATE_BATCH_SIZE = int(os.environ.get('BULK_CREATE_BATCH_SIZE', '100'))
+# Generate at least this many rows before using worker processes; below it
+# starting the pool costs more than it saves
+PARALLEL_MIN_ROWS = int(os.environ.get('LOADER_PARALLEL_MIN_ROWS', '2000'))
+
+# (name, description) of the categories the loader creates, in order
+CATEGORIES = (
+    ("Software Development", "Programming, coding, and software engineering roles"),
+    ("Data Science", "Data analysis, machine learning, and AI roles"),
+    ("Design", "UI/UX design, graphic design, and creative roles"),
+    ("Marketing", "Digital marketing, content creation, and advertising"),
+    ("Sales", "Business development and sales positions"),
+    ("Customer Support", "Customer service and support roles"),
+    ("Project Management", "Project coordination and management positions"),
+    ("DevOps", "Infrastructure, deployment, and operations"),
+    ("Quality Assurance", "Testing and quality control positions"),
+    ("Business Analysis", "Business analysis and consulting roles"),
+)
+
+# Job salary bounds (min, max) per experience level
+SALARY_RANGES = {
+    'entry': (30000, 60000),
+    'mid': (60000, 90000),
+    'senior': (90000, 130000),
+    'expert': (130000, 200000),
+}
+
+# Set LOADER_FIXTURE_CACHE=1 to reuse rows generated by an earlier run with
+# the same parameters instead of calling Faker again
+USE_FIXTURE_CACHE = os.environ.get('LOADER_FIXTURE_CACHE') == '1'
+FIXTURE_CACHE_DIR = os.path.join(os.path.dirname(backend_dir), 'tests', '.fixture_cache')
+# Bump when a row generator changes what it returns
+FIXTURE_CACHE_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def get_faker(locale='en_US'):
+    """Return a shared Faker for the locale
+    
+    Building a Faker loads its locale's provider modules, so repeated
+    DataLoader runs in one process reuse the first instance. Weighting is
+    off: picking names by real-world frequency costs a cumulative-weight
+    walk per call, and fake data doesn't need the distribution.
+    """
+    return Faker(locale, use_weighting=False)
+
+
+def _cached_rows(name, params, generate):
+    """Return generate(), or the rows it produced on an earlier cached run"""
+    if not USE_FIXTURE_CACHE:
+        return generate()
+    
+    key = hashlib.sha1(repr((params, FAKER_VERSION, FIXTURE_CACHE_VERSION)).encode()).hexdigest()
+    path = os.path.join(FIXTURE_CACHE_DIR, f"{name}-{key}.pkl")
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    
+    rows = generate()
+    os.makedirs(FIXTURE_CACHE_DIR, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(rows, f, pickle.HIGHEST_PROTOCOL)
+    return rows
+
+
+def _seed_worker(locale):
+    """Reseed a pool worker; forked workers inherit the parent's random state"""
+    random.seed()
+    get_faker(locale).seed_instance(random.getrandbits(64))
+
+
+def _generate_job_rows(args):
+    """Build field values for a chunk of jobs
+    
+    Runs in pool workers, so it only returns plain dicts; posted_by and
+    category are indexes into the loader's users and categories.
+    """
+    count, n_users, n_categories, locale = args
+    
+    employment_types = ('full_time', 'part_time', 'contract', 'internship', 'freelance')
+    experience_levels = ('entry', 'mid', 'senior', 'expert')
+    
+    job_titles = (
+        "Senior Python Developer", "Frontend React Developer", "Full Stack Engineer",
+        "Data Scientist", "Machine Learning Engineer", "DevOps Engineer",
+        "UI/UX Designer", "Product Manager", "Business Analyst", "QA Engineer",
+        "Backend Developer", "Mobile App Developer", "Cloud Architect",
+        "Security Engineer", "Database Administrator", "Technical Writer",
+        "Scrum Master", "Marketing Manager", "Sales Representative",
+        "Customer Success Manager", "HR Specialist", "Financial Analyst",
+        "Operations Manager", "Content Creator", "SEO Specialist"
+    )
+    
+    # Bind Faker providers once rather than resolving them per row
+    fake = get_faker(locale)
+    _company, _city, _country = fake.company, fake.city, fake.country
+    _text, _date_between, _date_time_between = fake.text, fake.date_between, fake.date_time_between
+    _rand = random.random
+    rows = []
+    for i in range(count):
+        # Random job poster (employer)
+        poster = int(_rand() * n_users)
+        category = int(_rand() * n_categories)
+        
+        # Generate job details
+        title = job_titles[int(_rand() * len(job_titles))]
+        company_name = _company()
+        location = f"{_city()}, {_country()}"
+        employment_type = employment_types[int(_rand() * len(employment_types))]
+        experience_level = experience_levels[int(_rand() * len(experience_levels))]
+        
+        # Salary range based on experience level
+        min_sal, max_sal = SALARY_RANGES[experience_level]
+        # Same inclusive ranges as randint(), without its per-call overhead
+        salary_min = min_sal + int(_rand() * 20001)
+        salary_max = salary_min + 10000 + int(_rand() * (max_sal - salary_min - 9999))
+        
+        rows.append(dict(
+            title=title,
+            description=_text(max_nb_chars=1000),
+            requirements=_text(max_nb_chars=500),
+            company_name=company_name,
+            location=location,
+            employment_type=employment_type,
+            experience_level=experience_level,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            application_deadline=_date_between(start_date='+1d', end_date='+90d'),
+            category=category,
+            posted_by=poster,
+            is_active=_rand() < 0.75,  # 75% active
+            created_at=_date_time_between(start_date='-30d', end_date='now'),
+        ))
+    return rows
+
 
 class DataLoader:
-    def __init__(self):
+    def __init__(self, locale='en_US'):
+        self.locale = locale
+        self.fake = get_faker(locale)
         self.users = []
         self.categories = []
         self.jobs = []
@@ -38,32 +188,26 @@ class DataLoader:
         """Create job categories"""
         print(f"Creating {count} categories...")
         
-        categories_data = [
-            {"name": "Software Development", "description": "Programming, coding, and software engineering roles"},
-            {"name": "Data Science", "description": "Data analysis, machine learning, and AI roles"},
-            {"name": "Design", "description": "UI/UX design, graphic design, and creative roles"},
-            {"name": "Marketing", "description": "Digital marketing, content creation, and advertising"},
-            {"name": "Sales", "description": "Business development and sales positions"},
-            {"name": "Customer Support", "description": "Customer service and support roles"},
-            {"name": "Project Management", "description": "Project coordination and management positions"},
-            {"name": "DevOps", "description": "Infrastructure, deployment, and operations"},
-            {"name": "Quality Assurance", "description": "Testing and quality control positions"},
-            {"name": "Business Analysis", "description": "Business analysis and consulting roles"},
-        ]
-        
-        for i, cat_data in enumerate(categories_data[:count]):
-            category, created = Category.objects.get_or_create(
-                name=cat_data["name"],
-                defaults={
-                    'description': cat_data["description"],
-                    'is_active': True,
-                }
-            )
-            if created:
-                print(f"  Created category: {category.name}")
-            else:
-                print(f"  Category already exists: {category.name}")
-            self.categories.append(category)
+        # bulk_create skips Category.save(), so fill in the slug here;
+        # categories that already exist are left untouched
+        categories_data = CATEGORIES[:count]
+        Category.objects.bulk_create(
+            [
+                Category(
+                    name=name,
+                    slug=slugify(name),
+                    description=description,
+                    is_active=True,
+                )
+                for name, description in categories_data
+            ],
+            ignore_conflicts=True,
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+        self.categories = list(
+            Category.objects.filter(name__in=[name for name, _ in categories_data])
+        )
+        print(f"  {len(self.categories)} categories available")
     
     def create_users(self, count=20):
         """Create test users with profiles"""
@@ -80,18 +224,23 @@ class DataLoader:
                 'is_admin': True,
                 'is_staff': True,
                 'is_superuser': True,
+                'password': make_password('admin123'),
             }
         )
         if created:
-            admin.set_password('admin123')
-            admin.save()
             print("  Created admin user (username: admin, password: admin123)")
         self.users.append(admin)
         
         # Create regular users
+        fake = self.fake
+        fake_first_name, fake_last_name = fake.first_name, fake.last_name
+        # Hash the shared password once and insert it with each row, rather
+        # than hashing per user and saving again after the INSERT
+        password_hash = make_password('password123')
+        created_count = 0
         for i in range(count - 1):
-            first_name = fake.first_name()
-            last_name = fake.last_name()
+            first_name = fake_first_name()
+            last_name = fake_last_name()
             username = f"{first_name.lower()}{last_name.lower()}{i+1}"
             email = f"{username}@example.com"
             full_name = f"{first_name} {last_name}"
@@ -104,15 +253,17 @@ class DataLoader:
                     'last_name': last_name,
                     'full_name': full_name,
                     'is_admin': False,
+                    'password': password_hash,
                 }
             )
             
             if created:
-                user.set_password('password123')
-                user.save()
-                print(f"  Created user: {username}")
+                created_count += 1
+                logger.debug(f"Created user: {username}")
             
             self.users.append(user)
+        
+        print(f"  Created {created_count} users")
     
     def create_user_profiles(self):
         """Create user profiles for all users"""
@@ -127,131 +278,178 @@ class DataLoader:
             "Adobe Creative Suite", "Project Management", "Leadership", "Communication"
         ]
         
-        experience_levels = ['entry', 'mid', 'senior', 'expert']
-        genders = ['male', 'female', 'other', 'prefer_not_to_say']
+        experience_levels = ('entry', 'mid', 'senior', 'expert')
+        genders = ('male', 'female', 'other', 'prefer_not_to_say')
+        
+        skills_tuple = tuple(skills_list)
+        
+        # One query for the users that already have a profile
+        self.profiles = list(UserProfile.objects.filter(user__in=self.users))
+        existing = {profile.user_id for profile in self.profiles}
+        
+        # Bind Faker providers once rather than resolving them per row
+        fake = self.fake
+        _text, _date_of_birth, _phone_number, _address = (
+            fake.text, fake.date_of_birth, fake.phone_number, fake.address
+        )
+        _city, _country, _postcode, _job, _company, _url = (
+            fake.city, fake.country, fake.postcode, fake.job, fake.company, fake.url
+        )
+        # Index with random() directly; choice() goes through _randbelow per call
+        _rand = random.random
+        new_users = [user for user in self.users if user.id not in existing]
+        
+        # Draw every profile's 3-8 skills in one pass before building rows
+        _sample = random.sample
+        skill_sets = [
+            ', '.join(_sample(skills_tuple, 3 + int(_rand() * 6)))
+            for _ in new_users
+        ]
         
-        for user in self.users:
-            profile, created = UserProfile.objects.get_or_create(
+        to_create = []
+        for user, skills in zip(new_users, skill_sets):
+            profile = UserProfile(
                 user=user,
-                defaults={
-                    'bio': fake.text(max_nb_chars=500),
-                    'date_of_birth': fake.date_of_birth(minimum_age=22, maximum_age=65),
-                    'gender': random.choice(genders),
-                    'phone_number': fake.phone_number(),
-                    'address': fake.address(),
-                    'city': fake.city(),
-                    'country': fake.country(),
-                    'postal_code': fake.postcode(),
-                    'job_title': fake.job(),
-                    'company': fake.company(),
-                    'experience_level': random.choice(experience_levels),
-                    'expected_salary_min': random.randint(30000, 80000),
-                    'expected_salary_max': random.randint(80000, 150000),
-                    'skills': ', '.join(random.sample(skills_list, random.randint(3, 8))),
-                    'education': fake.text(max_nb_chars=300),
-                    'certifications': fake.text(max_nb_chars=200),
-                    'linkedin_url': f"https://linkedin.com/in/{user.username}",
-                    'github_url': f"https://github.com/{user.username}",
-                    'website_url': fake.url(),
-                    'is_profile_public': random.choice([True, True, True, False]),  # 75% public
-                    'is_available_for_hire': random.choice([True, True, False]),  # 66% available
-                }
+                bio=_text(max_nb_chars=500),
+                date_of_birth=_date_of_birth(minimum_age=22, maximum_age=65),
+                gender=genders[int(_rand() * len(genders))],
+                phone_number=_phone_number(),
+                address=_address(),
+                city=_city(),
+                country=_country(),
+                postal_code=_postcode(),
+                job_title=_job(),
+                company=_company(),
+                experience_level=experience_levels[int(_rand() * len(experience_levels))],
+                expected_salary_min=30000 + int(_rand() * 50001),
+                expected_salary_max=80000 + int(_rand() * 70001),
+                skills=skills,
+                education=_text(max_nb_chars=300),
+                certifications=_text(max_nb_chars=200),
+                linkedin_url=f"https://linkedin.com/in/{user.username}",
+                github_url=f"https://github.com/{user.username}",
+                website_url=_url(),
+                is_profile_public=_rand() < 0.75,  # 75% public
+                is_available_for_hire=_rand() < 2 / 3,  # 66% available
             )
-            
-            if created:
-                print(f"  Created profile for: {user.username}")
-            
-            self.profiles.append(profile)
+            # bulk_create skips UserProfile.save(), so do its work here
+            profile.profile_completion = profile.compute_profile_completion()
+            profile._encrypt_fields()
+            to_create.append(profile)
+        
+        created = UserProfile.objects.bulk_create(to_create, batch_size=BULK_CREATE_BATCH_SIZE)
+        self._sync_profile_skills(created)
+        self.profiles.extend(created)
+        print(f"  Created {len(created)} profiles")
+    
+    def _sync_profile_skills(self, profiles):
+        """Fill skill_set for freshly bulk-created profiles in a few queries"""
+        names_by_profile = {
+            profile.pk: {Skill.normalize(skill) for skill in profile.skills_list}
+            for profile in profiles
+        }
+        all_names = set().union(*names_by_profile.values())
+        Skill.objects.bulk_create(
+            [Skill(name=name) for name in all_names],
+            ignore_conflicts=True,
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+        skill_ids = dict(Skill.objects.filter(name__in=all_names).values_list('name', 'id'))
+        ProfileSkill.objects.bulk_create(
+            [
+                ProfileSkill(profile_id=profile_id, skill_id=skill_ids[name])
+                for profile_id, names in names_by_profile.items()
+                for name in names
+            ],
+            ignore_conflicts=True,
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
     
     def create_jobs(self, count=30):
         """Create job postings"""
         print(f"Creating {count} jobs...")
         
-        employment_types = ['full_time', 'part_time', 'contract', 'internship', 'freelance']
-        experience_levels = ['entry', 'mid', 'senior', 'expert']
+        users, categories = self.users, self.categories
         
-        job_titles = [
-            "Senior Python Developer", "Frontend React Developer", "Full Stack Engineer",
-            "Data Scientist", "Machine Learning Engineer", "DevOps Engineer",
-            "UI/UX Designer", "Product Manager", "Business Analyst", "QA Engineer",
-            "Backend Developer", "Mobile App Developer", "Cloud Architect",
-            "Security Engineer", "Database Administrator", "Technical Writer",
-            "Scrum Master", "Marketing Manager", "Sales Representative",
-            "Customer Success Manager", "HR Specialist", "Financial Analyst",
-            "Operations Manager", "Content Creator", "SEO Specialist"
-        ]
+        def generate():
+            if count < PARALLEL_MIN_ROWS:
+                return _generate_job_rows((count, len(users), len(categories), self.locale))
+            # Faker is pure Python, so spread row generation over processes;
+            # only the main process touches the database
+            processes = os.cpu_count() or 1
+            chunk = -(-count // processes)
+            tasks = [
+                (min(chunk, count - start), len(users), len(categories), self.locale)
+                for start in range(0, count, chunk)
+            ]
+            with multiprocessing.Pool(processes, _seed_worker, (self.locale,)) as pool:
+                return [row for chunk_rows in pool.map(_generate_job_rows, tasks) for row in chunk_rows]
         
-        for i in range(count):
-            # Random job poster (employer)
-            poster = random.choice(self.users)
-            category = random.choice(self.categories)
-            
-            # Generate job details
-            title = random.choice(job_titles)
-            company_name = fake.company()
-            location = f"{fake.city()}, {fake.country()}"
-            employment_type = random.choice(employment_types)
-            experience_level = random.choice(experience_levels)
-            
-            # Salary range based on experience level
-            salary_ranges = {
-                'entry': (30000, 60000),
-                'mid': (60000, 90000),
-                'senior': (90000, 130000),
-                'expert': (130000, 200000)
-            }
-            min_sal, max_sal = salary_ranges[experience_level]
-            salary_min = random.randint(min_sal, min_sal + 20000)
-            salary_max = random.randint(salary_min + 10000, max_sal)
-            
-            job = Job.objects.create(
-                title=title,
-                description=fake.text(max_nb_chars=1000),
-                requirements=fake.text(max_nb_chars=500),
-                company_name=company_name,
-                location=location,
-                employment_type=employment_type,
-                experience_level=experience_level,
-                salary_min=salary_min,
-                salary_max=salary_max,
-                application_deadline=fake.date_between(start_date='+1d', end_date='+90d'),
-                category=category,
-                posted_by=poster,
-                is_active=random.choice([True, True, True, False]),  # 75% active
-                created_at=fake.date_time_between(start_date='-30d', end_date='now'),
-            )
-            
-            print(f"  Created job: {title} at {company_name}")
-            self.jobs.append(job)
+        rows = _cached_rows('jobs', (count, len(users), len(categories), self.locale), generate)
+        
+        job_objs = []
+        for row in rows:
+            row['posted_by'] = users[row['posted_by']]
+            row['category'] = categories[row['category']]
+            job_objs.append(Job(**row))
+        
+        self.jobs = Job.objects.bulk_create(job_objs, batch_size=BULK_CREATE_BATCH_SIZE)
+        # bulk_create sends no post_save signals, so invalidate cached job payloads once
+        bump_featured_jobs_version()
+        print(f"  Created {len(self.jobs)} jobs")
     
     def create_applications(self, count=50):
         """Create job applications"""
         print(f"Creating {count} applications...")
         
-        statuses = ['pending', 'reviewed', 'shortlisted', 'rejected', 'hired']
+        statuses = ('pending', 'reviewed', 'shortlisted', 'rejected', 'hired')
+        
+        active_jobs = [j for j in self.jobs if j.is_active]
+        if not active_jobs:
+            print("  No active jobs to apply to")
+            return
         
+        # Pairs that already exist, fetched once and extended as we go so
+        # duplicates are skipped without a query per application
+        seen = set(
+            Application.objects.filter(job__in=active_jobs).values_list('applicant_id', 'job_id')
+        )
+        
+        # Bind Faker providers once rather than resolving them per row
+        fake = self.fake
+        _text, _date_time_between = fake.text, fake.date_time_between
+        _rand = random.random
+        users = self.users
+        applications = []
         for i in range(count):
             # Random applicant and job
-            applicant = random.choice(self.users)
-            job = random.choice([j for j in self.jobs if j.is_active])
+            applicant = users[int(_rand() * len(users))]
+            job = active_jobs[int(_rand() * len(active_jobs))]
             
             # Don't let users apply to their own jobs
-            if job.posted_by == applicant:
+            if job.posted_by_id == applicant.id:
                 continue
             
-            # Check if application already exists
-            if Application.objects.filter(applicant=applicant, job=job).exists():
+            # Skip if the application already exists
+            pair = (applicant.id, job.id)
+            if pair in seen:
                 continue
+            seen.add(pair)
             
-            application = Application.objects.create(
+            applications.append(Application(
                 applicant=applicant,
                 job=job,
-                cover_letter=fake.text(max_nb_chars=800),
-                status=random.choice(statuses),
-                applied_at=fake.date_time_between(start_date=job.created_at, end_date='now'),
-            )
-            
-            print(f"  Created application: {applicant.username} -> {job.title}")
+                cover_letter=_text(max_nb_chars=800),
+                status=statuses[int(_rand() * len(statuses))],
+                applied_at=_date_time_between(start_date=job.created_at, end_date='now'),
+            ))
+        
+        created = Application.objects.bulk_create(
+            applications, batch_size=BULK_CREATE_BATCH_SIZE, ignore_conflicts=True
+        )
+        # bulk_create sends no post_save signals, so invalidate cached job payloads once
+        bump_featured_jobs_version()
+        print(f"  Created {len(created)} applications")
     
     def load_all_data(self):
         """Load all fake data"""
@@ -259,20 +457,22 @@ class DataLoader:
         print("=" * 50)
         
         try:
-            self.create_categories(10)
-            print()
-            
-            self.create_users(25)
-            print()
-            
-            self.create_user_profiles()
-            print()
-            
-            self.create_jobs(40)
-            print()
-            
-            self.create_applications(60)
-            print()
+            # One transaction, so the whole load commits once
+            with transaction.atomic():
+                self.create_categories(10)
+                print()
+                
+                self.create_users(25)
+                print()
+                
+                self.create_user_profiles()
+                print()
+                
+                self.create_jobs(40)
+                print()
+                
+                self.create_applications(60)
+                print()
             
             print("=" * 50)
             print("✅ Fake data loaded successfully!")
@@ -294,8 +494,21 @@ class DataLoader:
 
 def main():
     """Main function to run the data loader"""
+    if os.environ.get('LOADER_VERBOSE') == '1':
+        # Buffer per-row messages and write them out in batches
+        handler = logging.handlers.MemoryHandler(
+            capacity=100,
+            flushLevel=logging.ERROR,
+            target=logging.StreamHandler(sys.stdout),
+        )
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+    
     loader = DataLoader()
-    loader.load_all_data()
+    try:
+        loader.load_all_data()
+    finally:
+        logging.shutdown()
 
 if __name__ == "__main__":
     main()
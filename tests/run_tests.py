@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Run the API test scripts concurrently and print their reports in order
+"""
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Independent scripts: each creates its own user and its own requests.Session
+SCRIPTS = ["test_api.py", "test_remember_me.py"]
+
+def run_script(name):
+    """Run one test script, returning its exit code and captured output"""
+    result = subprocess.run(
+        [sys.executable, os.path.join(TESTS_DIR, name)],
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode, result.stdout + result.stderr
+
+def main():
+    # The scripts spend their time waiting on the server, so run them side by
+    # side and buffer each one's output to keep the reports readable
+    with ThreadPoolExecutor(max_workers=len(SCRIPTS)) as executor:
+        results = list(executor.map(run_script, SCRIPTS))
+
+    exit_code = 0
+    for name, (returncode, output) in zip(SCRIPTS, results):
+        print(f"▶ {name}")
+        print(output)
+        exit_code = exit_code or returncode
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
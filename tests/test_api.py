@@ -2,54 +2,104 @@
 """
 Simple API test script to verify job board functionality
 """
+import sys
+import threading
 import requests
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://127.0.0.1:8000"
 
+# Keep-alive connection pool for the sequential requests on the main thread
+session = requests.Session()
+
+# requests.Session is not thread-safe, so each worker thread fetching the
+# public endpoints gets a session of its own
+_thread_local = threading.local()
+
+# Messages of failed checks; any make the script exit non-zero
+failures = []
+
+def fail(message):
+    """Report a failed check"""
+    print(message)
+    failures.append(message)
+
+def parse_json(response):
+    """Parse a response body with orjson, straight from the raw bytes"""
+    return orjson.loads(response.content)
+
+def get_public(url):
+    """GET a public endpoint with the calling thread's own session"""
+    thread_session = getattr(_thread_local, 'session', None)
+    if thread_session is None:
+        thread_session = _thread_local.session = requests.Session()
+    return thread_session.get(url)
+
+# Public endpoints don't depend on each other or on the login flow, so
+# they are requested concurrently up front
+PUBLIC_ENDPOINTS = {
+    "categories": "/api/categories/",
+    "jobs": "/api/jobs/",
+    "full_time_jobs": "/api/jobs/?employment_type=full_time",
+    "search_jobs": "/api/jobs/?search=engineer",
+    "profiles": "/api/profiles/",
+    "candidates": "/api/profiles/available_candidates/",
+    "swagger": "/swagger/",
+}
+
 def test_api():
     print("🚀 Testing Job Board API")
     print("=" * 50)
     
+    with ThreadPoolExecutor(max_workers=len(PUBLIC_ENDPOINTS)) as executor:
+        public = {
+            name: executor.submit(get_public, f"{BASE_URL}{path}")
+            for name, path in PUBLIC_ENDPOINTS.items()
+        }
+        run_tests(public)
+
+def run_tests(public):
+    """Run the checks in order, reading public responses from their futures"""
     # Test 1: Get all categories (public endpoint)
     print("\n1. Testing Categories API...")
-    response = requests.get(f"{BASE_URL}/api/categories/")
+    response = public["categories"].result()
     if response.status_code == 200:
-        categories = response.json()['results']
+        categories = parse_json(response)['results']
         print(f"✅ Found {len(categories)} categories")
         for cat in categories[:3]:
             print(f"   - {cat['name']}: {cat['job_count']} jobs")
     else:
-        print(f"❌ Categories API failed: {response.status_code}")
+        fail(f"❌ Categories API failed: {response.status_code}")
     
     # Test 2: Get all jobs (public endpoint)
     print("\n2. Testing Jobs API...")
-    response = requests.get(f"{BASE_URL}/api/jobs/")
+    response = public["jobs"].result()
     if response.status_code == 200:
-        jobs = response.json()['results']
+        jobs = parse_json(response)['results']
         print(f"✅ Found {len(jobs)} jobs")
         for job in jobs[:3]:
             print(f"   - {job['title']} at {job['company_name']} ({job['location']})")
     else:
-        print(f"❌ Jobs API failed: {response.status_code}")
+        fail(f"❌ Jobs API failed: {response.status_code}")
     
     # Test 3: Test job filtering
     print("\n3. Testing Job Filtering...")
-    response = requests.get(f"{BASE_URL}/api/jobs/?employment_type=full_time")
+    response = public["full_time_jobs"].result()
     if response.status_code == 200:
-        jobs = response.json()['results']
+        jobs = parse_json(response)['results']
         print(f"✅ Found {len(jobs)} full-time jobs")
     else:
-        print(f"❌ Job filtering failed: {response.status_code}")
+        fail(f"❌ Job filtering failed: {response.status_code}")
     
     # Test 4: Test job search
     print("\n4. Testing Job Search...")
-    response = requests.get(f"{BASE_URL}/api/jobs/?search=engineer")
+    response = public["search_jobs"].result()
     if response.status_code == 200:
-        jobs = response.json()['results']
+        jobs = parse_json(response)['results']
         print(f"✅ Found {len(jobs)} jobs matching 'engineer'")
     else:
-        print(f"❌ Job search failed: {response.status_code}")
+        fail(f"❌ Job search failed: {response.status_code}")
     
     # Test 5: User Registration
     print("\n5. Testing User Registration...")
@@ -60,11 +110,11 @@ def test_api():
         "last_name": "User",
         "full_name": "Test User"
     }
-    response = requests.post(f"{BASE_URL}/auth/register/", json=user_data)
+    response = session.post(f"{BASE_URL}/auth/register/", json=user_data)
     if response.status_code == 200:
         print("✅ User registration successful")
     else:
-        print(f"❌ User registration failed: {response.status_code}")
+        fail(f"❌ User registration failed: {response.status_code}")
         print(f"   Error: {response.text}")
     
     # Test 6: User Login
@@ -73,23 +123,23 @@ def test_api():
         "username": "testuser",
         "password": "testpass123"
     }
-    response = requests.post(f"{BASE_URL}/auth/login/", json=login_data)
+    response = session.post(f"{BASE_URL}/auth/login/", json=login_data)
     if response.status_code == 200:
-        token = response.json()['access']
+        token = parse_json(response)['access']
         print("✅ User login successful")
         
         # Test 7: Authenticated request
         print("\n7. Testing Authenticated Request...")
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(f"{BASE_URL}/api/applications/my_applications/", headers=headers)
+        response = session.get(f"{BASE_URL}/api/applications/my_applications/", headers=headers)
         if response.status_code == 200:
-            applications = response.json()
+            applications = parse_json(response)
             print(f"✅ Found {len(applications)} applications for authenticated user")
         else:
-            print(f"❌ Authenticated request failed: {response.status_code}")
+            fail(f"❌ Authenticated request failed: {response.status_code}")
             
     else:
-        print(f"❌ User login failed: {response.status_code}")
+        fail(f"❌ User login failed: {response.status_code}")
         print(f"   Error: {response.text}")
     
     # Test 8: Profile Management
@@ -98,9 +148,9 @@ def test_api():
         headers = {"Authorization": f"Bearer {token}"}
         
         # Get user profile
-        response = requests.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
+        response = session.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
         if response.status_code == 200:
-            profile = response.json()
+            profile = parse_json(response)
             print("✅ Retrieved user profile successfully")
             
             # Update profile
@@ -111,43 +161,43 @@ def test_api():
                 "city": "New York",
                 "is_available_for_hire": True
             }
-            response = requests.patch(f"{BASE_URL}/api/profiles/my_profile/", 
-                                    json=profile_data, headers=headers)
+            response = session.patch(f"{BASE_URL}/api/profiles/my_profile/", 
+                                   json=profile_data, headers=headers)
             if response.status_code == 200:
                 print("✅ Updated user profile successfully")
             else:
-                print(f"❌ Profile update failed: {response.status_code}")
+                fail(f"❌ Profile update failed: {response.status_code}")
         else:
-            print(f"❌ Profile retrieval failed: {response.status_code}")
+            fail(f"❌ Profile retrieval failed: {response.status_code}")
     
     # Test 9: Public Profiles
     print("\n9. Testing Public Profiles...")
-    response = requests.get(f"{BASE_URL}/api/profiles/")
+    response = public["profiles"].result()
     if response.status_code == 200:
-        profiles = response.json()['results']
+        profiles = parse_json(response)['results']
         print(f"✅ Found {len(profiles)} public profiles")
         for profile in profiles[:2]:
             user = profile.get('user', {})
             print(f"   - {user.get('username', 'Unknown')}: {profile.get('job_title', 'No title')}")
     else:
-        print(f"❌ Public profiles failed: {response.status_code}")
+        fail(f"❌ Public profiles failed: {response.status_code}")
     
     # Test 10: Available Candidates
     print("\n10. Testing Available Candidates...")
-    response = requests.get(f"{BASE_URL}/api/profiles/available_candidates/")
+    response = public["candidates"].result()
     if response.status_code == 200:
-        candidates = response.json()['results']
+        candidates = parse_json(response)['results']
         print(f"✅ Found {len(candidates)} available candidates")
     else:
-        print(f"❌ Available candidates failed: {response.status_code}")
+        fail(f"❌ Available candidates failed: {response.status_code}")
     
     # Test 11: API Documentation
     print("\n11. Testing API Documentation...")
-    response = requests.get(f"{BASE_URL}/swagger/")
+    response = public["swagger"].result()
     if response.status_code == 200:
         print("✅ Swagger documentation accessible")
     else:
-        print(f"❌ Swagger documentation failed: {response.status_code}")
+        fail(f"❌ Swagger documentation failed: {response.status_code}")
     
     print("\n" + "=" * 50)
     print("🎉 API Testing Complete!")
@@ -157,8 +207,11 @@ def test_api():
 if __name__ == "__main__":
     try:
         test_api()
+        sys.exit(1 if failures else 0)
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to the server.")
         print("💡 Make sure to run 'python manage.py runserver' first!")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
+        sys.exit(1)
@@ -2,34 +2,91 @@
 """
 Test script for media upload functionality (profile images and resumes)
 """
+import functools
 import requests
-import json
+import orjson
+import os
+import sys
 from io import BytesIO
 from PIL import Image
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 BASE_URL = "http://127.0.0.1:8000"
 
+# One keep-alive connection pool for every request in the script
+session = requests.Session()
+
+# Report lines are collected here and written to stdout in one go
+output_lines = []
+
+def report(line=""):
+    """Queue a line of report output"""
+    output_lines.append(line)
+
+def flush_report():
+    """Write all queued report lines with a single stdout write"""
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
+        sys.stdout.flush()
+        output_lines.clear()
+
+def send_json(method, url, payload, headers=None):
+    """Send a JSON body serialized with orjson"""
+    return session.request(
+        method, url, data=orjson.dumps(payload),
+        headers={**(headers or {}), 'Content-Type': 'application/json'}
+    )
+
+def parse_json(response):
+    """Parse a response body with orjson, straight from the raw bytes"""
+    return orjson.loads(response.content)
+
+def post_file(url, files, headers):
+    """POST a multipart upload, streaming the body when requests-toolbelt is installed
+    
+    Without it, requests builds the whole multipart body in memory first.
+    """
+    if MultipartEncoder is None:
+        return session.post(url, files=files, headers=headers)
+    
+    encoder = MultipartEncoder(fields=files)
+    return session.post(url, data=encoder, headers={**headers, 'Content-Type': encoder.content_type})
+
+TEST_PDF = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>\nendobj\nxref\n0 4\n0000000000 65535 f \n0000000010 00000 n \n0000000053 00000 n \n0000000125 00000 n \ntrailer\n<< /Size 4 /Root 1 0 R >>\nstartxref\n209\n%%EOF"
+
+def encode_jpeg(img, **options):
+    """Encode an image as JPEG into a buffer ready to upload"""
+    buffer = BytesIO()
+    img.save(buffer, format='JPEG', **options)
+    buffer.seek(0)
+    return buffer
+
+@functools.lru_cache(maxsize=None)
+def _test_image_bytes():
+    """Encode the simple test image once per run"""
+    img = Image.new('RGB', (300, 300), color='red')
+    return encode_jpeg(img).getvalue()
+
 def create_test_image():
     """Create a test image in memory"""
-    # Create a simple test image
-    img = Image.new('RGB', (300, 300), color='red')
-    img_byte_arr = BytesIO()
-    img.save(img_byte_arr, format='JPEG')
-    img_byte_arr.seek(0)
-    return img_byte_arr
+    return BytesIO(_test_image_bytes())
 
 def create_test_pdf():
     """Create a simple test PDF content"""
-    # Simple PDF-like content (not a real PDF, but for testing)
-    pdf_content = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>\nendobj\nxref\n0 4\n0000000000 65535 f \n0000000010 00000 n \n0000000053 00000 n \n0000000125 00000 n \ntrailer\n<< /Size 4 /Root 1 0 R >>\nstartxref\n209\n%%EOF"
-    return BytesIO(pdf_content)
+    # Simple PDF-like content (not a real PDF, but for testing);
+    # BytesIO shares the bytes object until it is written to
+    return BytesIO(TEST_PDF)
 
 def test_media_uploads():
-    print("🖼️ Testing Media Upload Functionality")
-    print("=" * 50)
+    report("🖼️ Testing Media Upload Functionality")
+    report("=" * 50)
     
     # First, register and login a user
-    print("\n1. Setting up test user...")
+    report("\n1. Setting up test user...")
     user_data = {
         "username": "mediatest",
         "password": "testpass123",
@@ -39,9 +96,9 @@ def test_media_uploads():
     }
     
     # Register user
-    response = requests.post(f"{BASE_URL}/auth/register/", json=user_data)
+    response = send_json("POST", f"{BASE_URL}/auth/register/", user_data)
     if response.status_code != 200:
-        print(f"❌ User registration failed: {response.status_code}")
+        report(f"❌ User registration failed: {response.status_code}")
         return
     
     # Login user
@@ -49,17 +106,17 @@ def test_media_uploads():
         "username": "mediatest",
         "password": "testpass123"
     }
-    response = requests.post(f"{BASE_URL}/auth/login/", json=login_data)
+    response = send_json("POST", f"{BASE_URL}/auth/login/", login_data)
     if response.status_code != 200:
-        print(f"❌ User login failed: {response.status_code}")
+        report(f"❌ User login failed: {response.status_code}")
         return
     
-    token = response.json()['access']
+    token = parse_json(response)['access']
     headers = {"Authorization": f"Bearer {token}"}
-    print("✅ User setup complete")
+    report("✅ User setup complete")
     
     # Test 2: Profile update with JSON data
-    print("\n2. Testing Profile Update with JSON...")
+    report("\n2. Testing Profile Update with JSON...")
     profile_data = {
         "bio": "I'm a test user for media uploads",
         "job_title": "Media Test Engineer",
@@ -68,134 +125,116 @@ def test_media_uploads():
         "is_available_for_hire": True
     }
     
-    response = requests.patch(f"{BASE_URL}/api/profiles/my_profile/", 
-                            json=profile_data, headers=headers)
+    response = send_json("PATCH", f"{BASE_URL}/api/profiles/my_profile/",
+                         profile_data, headers)
     if response.status_code == 200:
-        print("✅ Profile updated successfully with JSON data")
+        report("✅ Profile updated successfully with JSON data")
     else:
-        print(f"❌ Profile update failed: {response.status_code}")
-        print(f"   Error: {response.text}")
+        report(f"❌ Profile update failed: {response.status_code}")
+        report(f"   Error: {response.text}")
     
-    # Test 3: Upload profile image
-    print("\n3. Testing Profile Image Upload...")
+    # Test 3 & 4: Upload profile image and resume
+    report("\n3. Testing Profile Image Upload...")
     
-    # Get user profile first to get profile ID
-    response = requests.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
+    # The update response already carries the profile; only fetch it if the update failed
     if response.status_code != 200:
-        print(f"❌ Failed to get profile: {response.status_code}")
-        return
+        response = session.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
+        if response.status_code != 200:
+            report(f"❌ Failed to get profile: {response.status_code}")
+            return
     
-    profile = response.json()
+    profile = parse_json(response)
     profile_id = profile['id']
     
-    # Create test image
-    test_image = create_test_image()
-    
-    # Upload profile image
-    files = {
-        'profile_image': ('test_profile.jpg', test_image, 'image/jpeg')
-    }
-    
-    response = requests.post(
+    # Upload one file at a time: each endpoint saves the whole profile, so
+    # concurrent uploads overwrite each other's file column
+    response = session.post(
         f"{BASE_URL}/api/profiles/{profile_id}/upload_profile_image/",
-        files=files,
+        files={'profile_image': ('test_profile.jpg', create_test_image(), 'image/jpeg')},
         headers=headers
     )
-    
     if response.status_code == 200:
-        result = response.json()
-        print("✅ Profile image uploaded successfully")
-        print(f"   Image URL: {result.get('profile_image_url', 'N/A')}")
+        result = parse_json(response)
+        report("✅ Profile image uploaded successfully")
+        report(f"   Image URL: {result.get('profile_image_url', 'N/A')}")
     else:
-        print(f"❌ Profile image upload failed: {response.status_code}")
-        print(f"   Error: {response.text}")
-    
-    # Test 4: Upload resume
-    print("\n4. Testing Resume Upload...")
-    
-    # Create test PDF
-    test_pdf = create_test_pdf()
+        report(f"❌ Profile image upload failed: {response.status_code}")
+        report(f"   Error: {response.text}")
     
-    # Upload resume
-    files = {
-        'resume': ('test_resume.pdf', test_pdf, 'application/pdf')
-    }
-    
-    response = requests.post(
+    report("\n4. Testing Resume Upload...")
+    response = session.post(
         f"{BASE_URL}/api/profiles/{profile_id}/upload_resume/",
-        files=files,
+        files={'resume': ('test_resume.pdf', create_test_pdf(), 'application/pdf')},
         headers=headers
     )
-    
     if response.status_code == 200:
-        result = response.json()
-        print("✅ Resume uploaded successfully")
-        print(f"   Message: {result.get('message', 'N/A')}")
+        result = parse_json(response)
+        report("✅ Resume uploaded successfully")
+        report(f"   Message: {result.get('message', 'N/A')}")
     else:
-        print(f"❌ Resume upload failed: {response.status_code}")
-        print(f"   Error: {response.text}")
+        report(f"❌ Resume upload failed: {response.status_code}")
+        report(f"   Error: {response.text}")
     
     # Test 5: Verify uploads by getting profile
-    print("\n5. Verifying Uploaded Files...")
-    response = requests.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
+    report("\n5. Verifying Uploaded Files...")
+    response = session.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
     if response.status_code == 200:
-        profile = response.json()
+        profile = parse_json(response)
         
         profile_image_url = profile.get('profile_image_url')
         resume_url = profile.get('resume_url')
         
-        print("✅ Profile retrieved successfully")
-        print(f"   Profile Image: {'✅ Available' if profile_image_url else '❌ Not found'}")
-        print(f"   Resume: {'✅ Available' if resume_url else '❌ Not found'}")
+        report("✅ Profile retrieved successfully")
+        report(f"   Profile Image: {'✅ Available' if profile_image_url else '❌ Not found'}")
+        report(f"   Resume: {'✅ Available' if resume_url else '❌ Not found'}")
         
         if profile_image_url:
-            print(f"   Profile Image URL: {profile_image_url}")
+            report(f"   Profile Image URL: {profile_image_url}")
         if resume_url:
-            print(f"   Resume URL: {resume_url}")
+            report(f"   Resume URL: {resume_url}")
     else:
-        print(f"❌ Failed to verify uploads: {response.status_code}")
+        report(f"❌ Failed to verify uploads: {response.status_code}")
     
     # Test 6: Test file validation (oversized file)
-    print("\n6. Testing File Validation...")
+    report("\n6. Testing File Validation...")
     
-    # Try to upload a very large image (this should fail)
-    large_image = Image.new('RGB', (3000, 3000), color='blue')  # Large image
-    large_img_byte_arr = BytesIO()
-    large_image.save(large_img_byte_arr, format='JPEG', quality=100)
-    large_img_byte_arr.seek(0)
+    # Try to upload an image over the 5MB limit (this should fail); random
+    # noise barely compresses, so 2500x2500 at quality 95 comes out ~7MB
+    size = (2500, 2500)
+    large_image = Image.frombytes('RGB', size, os.urandom(size[0] * size[1] * 3))
+    large_img_byte_arr = encode_jpeg(large_image, quality=95)
     
-    files = {
-        'profile_image': ('large_test.jpg', large_img_byte_arr, 'image/jpeg')
-    }
-    
-    response = requests.post(
+    response = post_file(
         f"{BASE_URL}/api/profiles/{profile_id}/upload_profile_image/",
-        files=files,
-        headers=headers
+        {'profile_image': ('large_test.jpg', large_img_byte_arr, 'image/jpeg')},
+        headers
     )
     
     if response.status_code == 400:
-        print("✅ File size validation working correctly")
-        print(f"   Validation message: {response.json()}")
+        report("✅ File size validation working correctly")
+        report(f"   Validation message: {parse_json(response)}")
     else:
-        print(f"⚠️  File size validation may not be working: {response.status_code}")
-    
-    print("\n" + "=" * 50)
-    print("🎉 Media Upload Testing Complete!")
-    print("\n💡 Key Features Tested:")
-    print("   ✅ JSON profile updates")
-    print("   ✅ Profile image upload")
-    print("   ✅ Resume file upload")
-    print("   ✅ File validation")
-    print("   ✅ Media URL generation")
+        report(f"⚠️  File size validation may not be working: {response.status_code}")
+    
+    report("\n" + "=" * 50)
+    report("🎉 Media Upload Testing Complete!")
+    report("\n💡 Key Features Tested:")
+    report("   ✅ JSON profile updates")
+    report("   ✅ Profile image upload")
+    report("   ✅ Resume file upload")
+    report("   ✅ File validation")
+    report("   ✅ Media URL generation")
 
 if __name__ == "__main__":
     try:
         test_media_uploads()
     except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to the server.")
-        print("💡 Make sure to run 'python manage.py runserver' first!")
+        report("❌ Cannot connect to the server.")
+        report("💡 Make sure to run 'python manage.py runserver' first!")
     except Exception as e:
-        print(f"❌ Test failed with error: {e}")
+        report(f"❌ Test failed with error: {e}")
         import traceback
+        flush_report()
         traceback.print_exc()
+    finally:
+        flush_report()
@@ -2,13 +2,29 @@
 """
 Integration test for remember me functionality
 """
+import sys
 import requests
-import json
+import orjson
 import time
 from datetime import datetime, timedelta
 
 BASE_URL = "http://127.0.0.1:8000"
 
+# One keep-alive connection pool for every request in the script
+session = requests.Session()
+
+# Messages of failed checks; any make the script exit non-zero
+failures = []
+
+def fail(message):
+    """Report a failed check"""
+    print(message)
+    failures.append(message)
+
+def parse_json(response):
+    """Parse a response body with orjson, straight from the raw bytes"""
+    return orjson.loads(response.content)
+
 def test_remember_me_functionality():
     print("🔒 Testing Remember Me Functionality")
     print("=" * 50)
@@ -23,9 +39,9 @@ def test_remember_me_functionality():
         "full_name": "Remember Me User"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/register/", json=user_data)
+    response = session.post(f"{BASE_URL}/auth/register/", json=user_data)
     if response.status_code != 200:
-        print(f"❌ User registration failed: {response.status_code}")
+        fail(f"❌ User registration failed: {response.status_code}")
         print(f"   Error: {response.text}")
         return
     
@@ -39,9 +55,9 @@ def test_remember_me_functionality():
         "remember_me": False
     }
     
-    response = requests.post(f"{BASE_URL}/auth/login/", json=login_data)
+    response = session.post(f"{BASE_URL}/auth/login/", json=login_data)
     if response.status_code == 200:
-        data = response.json()
+        data = parse_json(response)
         print("✅ Login without remember me successful")
         print(f"   Token expires in: {data.get('expires_in', 'N/A')}")
         print(f"   Remember me: {data.get('remember_me', 'N/A')}")
@@ -50,9 +66,9 @@ def test_remember_me_functionality():
         if data.get('expires_in') == '1 hour' and not data.get('remember_me'):
             print("✅ Correct token expiration for non-remember me login")
         else:
-            print("❌ Incorrect token configuration for non-remember me login")
+            fail("❌ Incorrect token configuration for non-remember me login")
     else:
-        print(f"❌ Login without remember me failed: {response.status_code}")
+        fail(f"❌ Login without remember me failed: {response.status_code}")
         print(f"   Error: {response.text}")
     
     # Test 3: Login with remember me (should get 15 days token)
@@ -63,9 +79,9 @@ def test_remember_me_functionality():
         "remember_me": True
     }
     
-    response = requests.post(f"{BASE_URL}/auth/login/", json=login_data_remember)
+    response = session.post(f"{BASE_URL}/auth/login/", json=login_data_remember)
     if response.status_code == 200:
-        data = response.json()
+        data = parse_json(response)
         print("✅ Login with remember me successful")
         print(f"   Token expires in: {data.get('expires_in', 'N/A')}")
         print(f"   Remember me: {data.get('remember_me', 'N/A')}")
@@ -74,7 +90,7 @@ def test_remember_me_functionality():
         if data.get('expires_in') == '15 days' and data.get('remember_me'):
             print("✅ Correct token expiration for remember me login")
         else:
-            print("❌ Incorrect token configuration for remember me login")
+            fail("❌ Incorrect token configuration for remember me login")
             
         # Store tokens for further testing
         access_token = data.get('access')
@@ -83,28 +99,28 @@ def test_remember_me_functionality():
         # Test 4: Test authenticated request with remember me token
         print("\n4. Testing authenticated request with remember me token...")
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
+        response = session.get(f"{BASE_URL}/api/profiles/my_profile/", headers=headers)
         
         if response.status_code == 200:
             print("✅ Authenticated request with remember me token successful")
         else:
-            print(f"❌ Authenticated request failed: {response.status_code}")
+            fail(f"❌ Authenticated request failed: {response.status_code}")
         
         # Test 5: Test refresh token functionality (if available)
         if refresh_token:
             print("\n5. Testing refresh token functionality...")
             refresh_data = {"refresh": refresh_token}
-            response = requests.post(f"{BASE_URL}/api/token/refresh/", json=refresh_data)
+            response = session.post(f"{BASE_URL}/api/token/refresh/", json=refresh_data)
             
             if response.status_code == 200:
-                new_data = response.json()
+                new_data = parse_json(response)
                 print("✅ Token refresh successful")
                 print(f"   New access token received: {'access' in new_data}")
             else:
-                print(f"❌ Token refresh failed: {response.status_code}")
+                fail(f"❌ Token refresh failed: {response.status_code}")
                 print(f"   Error: {response.text}")
     else:
-        print(f"❌ Login with remember me failed: {response.status_code}")
+        fail(f"❌ Login with remember me failed: {response.status_code}")
         print(f"   Error: {response.text}")
     
     # Test 6: Login with default (no remember_me field)
@@ -114,9 +130,9 @@ def test_remember_me_functionality():
         "password": "testpass123"
     }
     
-    response = requests.post(f"{BASE_URL}/auth/login/", json=login_data_default)
+    response = session.post(f"{BASE_URL}/auth/login/", json=login_data_default)
     if response.status_code == 200:
-        data = response.json()
+        data = parse_json(response)
         print("✅ Login with default settings successful")
         print(f"   Token expires in: {data.get('expires_in', 'N/A')}")
         print(f"   Remember me: {data.get('remember_me', 'N/A')}")
@@ -125,16 +141,16 @@ def test_remember_me_functionality():
         if data.get('expires_in') == '1 hour' and not data.get('remember_me'):
             print("✅ Default remember me setting works correctly (False)")
         else:
-            print("❌ Default remember me setting not working correctly")
+            fail("❌ Default remember me setting not working correctly")
     else:
-        print(f"❌ Login with default settings failed: {response.status_code}")
+        fail(f"❌ Login with default settings failed: {response.status_code}")
         print(f"   Error: {response.text}")
     
     # Test 7: Test invalid login scenarios
     print("\n7. Testing invalid login scenarios...")
     
     # Invalid JSON
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/auth/login/", 
         data='invalid json', 
         headers={'Content-Type': 'application/json'}
@@ -142,21 +158,21 @@ def test_remember_me_functionality():
     if response.status_code == 400:
         print("✅ Invalid JSON handling works correctly")
     else:
-        print(f"❌ Invalid JSON not handled properly: {response.status_code}")
+        fail(f"❌ Invalid JSON not handled properly: {response.status_code}")
     
     # Missing username
-    response = requests.post(f"{BASE_URL}/auth/login/", json={"password": "testpass123"})
+    response = session.post(f"{BASE_URL}/auth/login/", json={"password": "testpass123"})
     if response.status_code == 400:
         print("✅ Missing username validation works correctly")
     else:
-        print(f"❌ Missing username not validated properly: {response.status_code}")
+        fail(f"❌ Missing username not validated properly: {response.status_code}")
     
     # Missing password
-    response = requests.post(f"{BASE_URL}/auth/login/", json={"username": "remembermetest"})
+    response = session.post(f"{BASE_URL}/auth/login/", json={"username": "remembermetest"})
     if response.status_code == 400:
         print("✅ Missing password validation works correctly")
     else:
-        print(f"❌ Missing password not validated properly: {response.status_code}")
+        fail(f"❌ Missing password not validated properly: {response.status_code}")
     
     print("\n" + "=" * 50)
     print("🎉 Remember Me Testing Complete!")
@@ -171,10 +187,13 @@ def test_remember_me_functionality():
 if __name__ == "__main__":
     try:
         test_remember_me_functionality()
+        sys.exit(1 if failures else 0)
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to the server.")
         print("💡 Make sure to run 'python manage.py runserver' first!")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
         import traceback
         traceback.print_exc()
+        sys.exit(1)